@@ -0,0 +1,151 @@
+import argparse
+import fnmatch
+import heapq
+import math
+import time
+from collections import Counter
+
+from crawler import crawl_files, CrawlStats, add_crawl_arguments, crawl_options
+from invertedIndex import InvertedIndex, parse_query, DEFAULT_MAX_EXPANSIONS
+from main import load_kamus, stem_words, stem_constraints
+from pipeline import IngestPipeline
+
+DEFAULT_BATCH_SIZE = 50
+
+
+class ProgressUpdate:
+    def __init__(self, processed, matched, elapsed, top, threshold, crawl_stats, done):
+        self.processed = processed  # jumlah file yang sudah diproses
+        self.matched = matched      # jumlah file dengan skor > 0
+        self.elapsed = elapsed
+        self.top = top              # daftar (file_path, skor) sementara, terurut menurun
+        self.threshold = threshold  # skor minimum agar dokumen baru masuk top-k
+        self.crawl_stats = crawl_stats
+        self.done = done            # True jika seluruh folder sudah diproses
+
+
+# Fungsi untuk menghitung cosine similarity antara query dan term satu dokumen
+def score_document(query_counts, query_norm, terms):
+    doc_counts = Counter(terms)
+    dot_product = sum(doc_counts[term] * count for term, count in query_counts.items())
+    if dot_product == 0:
+        return 0.0
+    doc_norm = math.sqrt(sum(c ** 2 for c in doc_counts.values()))
+    return dot_product / (doc_norm * query_norm)
+
+
+# Fungsi untuk mengekspansi pola wildcard terhadap term satu dokumen (belum ada kamus global),
+# paling banyak max_expansions term per pola
+def expand_wildcards(patterns, terms, max_expansions=DEFAULT_MAX_EXPANSIONS):
+    doc_terms = set(terms)
+    expanded = []
+    for pattern in patterns:
+        expanded.extend(sorted(term for term in doc_terms if fnmatch.fnmatchcase(term, pattern))[:max_expansions])
+    return expanded
+
+
+# Fungsi untuk memeriksa frasa dan NEAR/k pada satu dokumen
+def satisfies_constraints(file_path, terms, phrases, nears):
+    index = InvertedIndex(store_positions=True)
+    index.add_document(file_path, terms)
+    return bool(index.constrained_docs(phrases, nears))
+
+
+# Fungsi untuk pencarian ad-hoc pada folder yang belum diindeks. File diproses sebagai aliran;
+# setelah setiap batch dihasilkan ProgressUpdate berisi top-k sementara. Skor cosine tiap dokumen
+# tidak bergantung pada dokumen lain, jadi top-k sementara sudah pasti untuk file yang diproses dan
+# hanya bisa digeser oleh dokumen baru yang skornya melebihi threshold.
+# Wildcard dicocokkan dengan term masing-masing dokumen, sehingga vektor query dapat berbeda per dokumen.
+# Pencarian dibatalkan cukup dengan berhenti mengambil update (atau max_files tercapai).
+def progressive_search(folder_path, query, kamus, k=10, batch_size=DEFAULT_BATCH_SIZE,
+                       max_files=None, crawl_options=None, max_expansions=DEFAULT_MAX_EXPANSIONS):
+    if k < 1:
+        raise ValueError(f"k harus minimal 1 (diberikan {k}).")
+    if batch_size < 1:
+        raise ValueError(f"batch_size harus minimal 1 (diberikan {batch_size}).")
+
+    parsed_query = parse_query(query)
+    query_counts = Counter(stem_words(parsed_query.words, kamus))
+    query_norm = math.sqrt(sum(c ** 2 for c in query_counts.values()))
+    phrases, nears = stem_constraints(parsed_query, kamus)
+
+    stats = CrawlStats()
+    pipeline = IngestPipeline(kamus)
+    results = pipeline.run(crawl_files(folder_path, stats=stats, **(crawl_options or {})))
+
+    # Min-heap berukuran k: (skor, urutan, file_path); heap[0] adalah batas skor top-k
+    heap = []
+    processed = matched = 0
+    start = time.perf_counter()
+
+    def update(done):
+        top = [(file_path, score) for score, _, file_path in sorted(heap, reverse=True)]
+        threshold = heap[0][0] if len(heap) >= k else 0.0
+        return ProgressUpdate(processed, matched, time.perf_counter() - start, top, threshold, stats, done)
+
+    try:
+        for file_path, terms in results:
+            processed += 1
+            doc_query_counts, doc_query_norm = query_counts, query_norm
+            if parsed_query.wildcards:
+                expanded = expand_wildcards(parsed_query.wildcards, terms, max_expansions)
+                if expanded:
+                    doc_query_counts = query_counts + Counter(expanded)
+                    doc_query_norm = math.sqrt(sum(c ** 2 for c in doc_query_counts.values()))
+            score = score_document(doc_query_counts, doc_query_norm, terms) if doc_query_norm else 0.0
+            if score > 0 and (phrases or nears) and not satisfies_constraints(file_path, terms, phrases, nears):
+                score = 0.0
+            if score > 0:
+                matched += 1
+                if len(heap) < k:
+                    heapq.heappush(heap, (score, processed, file_path))
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, (score, processed, file_path))
+
+            if max_files is not None and processed >= max_files:
+                break
+            if processed % batch_size == 0:
+                yield update(done=False)
+        else:
+            yield update(done=True)
+            return
+        yield update(done=False)
+    finally:
+        results.close()
+
+
+# Program pencarian ad-hoc dengan hasil bertahap; Ctrl+C menghentikan pencarian
+def main():
+    parser = argparse.ArgumentParser(description="Pencarian ad-hoc bertahap pada folder yang belum diindeks.")
+    parser.add_argument('folder', help="direktori folder yang berisi file")
+    parser.add_argument('query')
+    parser.add_argument('-k', type=int, default=10)
+    parser.add_argument('--batch', type=int, default=DEFAULT_BATCH_SIZE, help="jumlah file per update")
+    parser.add_argument('--max-files', type=int, help="berhenti setelah sejumlah file")
+    parser.add_argument('--kamus', default='data/kamus.txt')
+    add_crawl_arguments(parser)
+    args = parser.parse_args()
+
+    kamus = load_kamus(args.kamus)
+    last = None
+    try:
+        for last in progressive_search(args.folder, args.query, kamus, k=args.k,
+                                       batch_size=args.batch, max_files=args.max_files,
+                                       crawl_options=crawl_options(args)):
+            status = "selesai" if last.done else "sementara"
+            print(f"\n[{last.processed} file, {last.matched} cocok, {last.elapsed:.1f} detik] "
+                  f"top-{args.k} {status}, batas skor: {last.threshold:.5f}")
+            for rank, (file_path, sim) in enumerate(last.top, 1):
+                print(f"{rank}. {sim:.5f} -> {file_path}")
+    except KeyboardInterrupt:
+        print("\nPencarian dihentikan.")
+    except ValueError as error:
+        print(f"Error: {error}")
+        return
+
+    if last is not None and not last.done:
+        print(f"\nHasil di atas berasal dari {last.processed} file pertama.")
+
+
+if __name__ == "__main__":
+    main()
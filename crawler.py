@@ -0,0 +1,153 @@
+import os
+import re
+import fnmatch
+from collections import Counter
+
+# Pola bawaan: format yang bisa dibaca oleh read_txt/read_docx/read_pdf
+DEFAULT_INCLUDE = ['*.txt', '*.docx', '*.pdf']
+
+
+class CrawlStats:
+    def __init__(self):
+        self.files = 0
+        self.dirs = 0
+        self.total_bytes = 0
+        self.skipped_pattern = 0
+        self.skipped_size = 0
+        self.skipped_symlink = 0
+        self.errors = 0
+        self.extensions = Counter()
+
+    def summary(self, folder_path):
+        lines = [f"Ringkasan direktori {os.path.basename(os.path.normpath(folder_path))}:",
+                 f"- folder ditelusuri : {self.dirs}",
+                 f"- file ditemukan    : {self.files}"]
+        for ext, count in sorted(self.extensions.items()):
+            lines.append(f"    {ext:<6} : {count}")
+        if self.total_bytes:
+            lines.append(f"- total ukuran      : {self.total_bytes} byte")
+        lines.append(f"- dilewati (pola)   : {self.skipped_pattern}")
+        lines.append(f"- dilewati (ukuran) : {self.skipped_size}")
+        lines.append(f"- dilewati (symlink): {self.skipped_symlink}")
+        if self.errors:
+            lines.append(f"- gagal dibaca      : {self.errors}")
+        return '\n'.join(lines)
+
+
+# Fungsi untuk menggabungkan daftar pola glob menjadi satu regex (None jika daftar kosong)
+def compile_patterns(patterns):
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
+# Fungsi untuk mencocokkan nama atau path relatif dengan pola hasil compile_patterns.
+# rel_path boleh None jika tidak ada pola yang memuat pemisah folder.
+def match_patterns(name, rel_path, pattern):
+    if pattern.match(os.path.normcase(name)):
+        return True
+    return rel_path is not None and pattern.match(os.path.normcase(rel_path)) is not None
+
+
+# Fungsi untuk menambahkan opsi penelusuran folder pada parser argparse
+def add_crawl_arguments(parser):
+    parser.add_argument('--include', action='append', metavar='POLA',
+                        help=f"pola file yang diproses, boleh diulang (bawaan: {' '.join(DEFAULT_INCLUDE)})")
+    parser.add_argument('--exclude', action='append', metavar='POLA',
+                        help="pola file/folder yang dilewati, boleh diulang (mis. 'arsip/*')")
+    parser.add_argument('--min-size', type=int, metavar='BYTE', help="lewati file yang lebih kecil")
+    parser.add_argument('--max-size', type=int, metavar='BYTE', help="lewati file yang lebih besar")
+    parser.add_argument('--follow-symlinks', action='store_true', help="ikuti symlink")
+
+
+# Fungsi untuk mengambil opsi crawl_files dari hasil parse_args
+def crawl_options(args):
+    return {'include': args.include, 'exclude': args.exclude, 'min_size': args.min_size,
+            'max_size': args.max_size, 'follow_symlinks': args.follow_symlinks}
+
+
+# Fungsi untuk menelusuri folder secara rekursif dan menghasilkan path file satu per satu.
+# Memakai os.scandir agar tipe entri diambil dari hasil listing direktori tanpa stat tambahan;
+# stat hanya dipanggil jika batas ukuran dipakai atau symlink diikuti.
+def crawl_files(folder_path, include=None, exclude=None, min_size=None, max_size=None,
+                follow_symlinks=False, stats=None):
+    include = DEFAULT_INCLUDE if include is None else include
+    exclude = exclude or []
+    # Path relatif hanya dibentuk jika ada pola yang memuat pemisah folder (mis. arsip/*.pdf)
+    need_rel = any('/' in p or os.sep in p for p in list(include) + list(exclude))
+    include_pattern = compile_patterns(include)
+    exclude_pattern = compile_patterns(exclude)
+    stats = stats if stats is not None else CrawlStats()
+    check_size = min_size is not None or max_size is not None
+
+    # Penanda (st_dev, st_ino) folder yang sudah dikunjungi agar symlink melingkar tidak diulang
+    visited = set()
+    if follow_symlinks:
+        try:
+            st = os.stat(folder_path)
+            visited.add((st.st_dev, st.st_ino))
+        except OSError:
+            pass
+
+    # Tumpukan eksplisit, bukan rekursi, supaya pohon yang dalam tidak melewati batas rekursi
+    # Setiap elemen: (path folder, prefix path relatif terhadap folder_path)
+    stack = [(folder_path, '')]
+    while stack:
+        current, rel_prefix = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                # Folder baru dihitung setelah berhasil dibuka
+                stats.dirs += 1
+                subdirs = []
+                for entry in entries:
+                    rel_path = rel_prefix + entry.name if need_rel else None
+                    try:
+                        is_link = entry.is_symlink()
+                        if is_link and not follow_symlinks:
+                            stats.skipped_symlink += 1
+                            continue
+
+                        if entry.is_dir(follow_symlinks=follow_symlinks):
+                            if exclude_pattern and match_patterns(entry.name, rel_path, exclude_pattern):
+                                stats.skipped_pattern += 1
+                                continue
+                            # Setiap folder (bukan hanya symlink) ditandai, sehingga folder yang
+                            # dicapai lewat dua jalur hanya ditelusuri sekali
+                            if follow_symlinks:
+                                st = entry.stat()
+                                key = (st.st_dev, st.st_ino)
+                                if key in visited:
+                                    stats.skipped_symlink += 1
+                                    continue
+                                visited.add(key)
+                            subdirs.append((entry.path, rel_prefix + entry.name + os.sep))
+                            continue
+
+                        if not entry.is_file(follow_symlinks=follow_symlinks):
+                            continue
+
+                        if include_pattern is None or not match_patterns(entry.name, rel_path, include_pattern) or \
+                                (exclude_pattern and match_patterns(entry.name, rel_path, exclude_pattern)):
+                            stats.skipped_pattern += 1
+                            continue
+
+                        if check_size:
+                            size = entry.stat(follow_symlinks=follow_symlinks).st_size
+                            if (min_size is not None and size < min_size) or \
+                                    (max_size is not None and size > max_size):
+                                stats.skipped_size += 1
+                                continue
+                            stats.total_bytes += size
+                    except OSError:
+                        stats.errors += 1
+                        continue
+
+                    stats.files += 1
+                    dot = entry.name.rfind('.')
+                    stats.extensions[entry.name[dot:].lower() if dot > 0 else '-'] += 1
+                    yield entry.path
+
+                # Dibalik agar folder ditelusuri sesuai urutan listing
+                stack.extend(reversed(sorted(subdirs)))
+        except OSError:
+            stats.errors += 1
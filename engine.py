@@ -0,0 +1,211 @@
+import os
+import threading
+
+from main import load_stopwords_from_csv, load_kamus, stem_words, stem_constraints
+from invertedIndex import InvertedIndex, parse_query, DEFAULT_MAX_EXPANSIONS
+from pipeline import IngestPipeline, DEFAULT_READERS
+from snippets import SnippetStore, SNIPPETS_FILE
+from spimi import load_index
+
+STOPWORD_FILE = 'data/stopwordbahasa.csv'
+KAMUS_FILE = 'data/kamus.txt'
+SEARCH_MODES = ('vsm', 'lsa')
+
+
+class ReadWriteLock:
+    # Banyak pembaca boleh masuk bersamaan; penulis menunggu sampai tidak ada pembaca
+    # dan menahan pembaca baru selama ada penulis yang menunggu
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+
+    def release_write(self):
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+
+class SearchEngine:
+    # Stopwords, kamus dan indeks dimuat sekali lalu dipakai ulang oleh setiap pemanggilan.
+    # search() dan stats() aman dipanggil dari banyak thread; add_documents() dan remove()
+    # hanya mengunci indeks saat mengubahnya, parsing file dilakukan di luar kunci.
+    # Dengan snippets=True potongan teks disimpan saat ingest untuk hasil pencarian yang disorot;
+    # potongan teks yang disimpan spimi.py --snippets di index_dir selalu dimuat.
+    def __init__(self, stopword_file=STOPWORD_FILE, kamus_file=KAMUS_FILE, index_dir=None,
+                 store_positions=True, compressed=True, max_expansions=DEFAULT_MAX_EXPANSIONS,
+                 snippets=False):
+        self.stopwords = load_stopwords_from_csv(stopword_file)
+        self.kamus = load_kamus(kamus_file)
+        self.max_expansions = max_expansions
+        if index_dir is not None:
+            self.index = load_index(index_dir, compressed=compressed)
+        else:
+            self.index = InvertedIndex(store_positions=store_positions, compressed=compressed)
+        self.snippets = SnippetStore(stem=self._stem) if snippets else None
+        self.lsa = None
+        # Path yang dihapus atau diganti sejak model LSA dibangun; embedding-nya di model sudah usang
+        self._lsa_stale = set()
+        if index_dir is not None:
+            self.load_snippets(index_dir)
+            self.load_lsa(index_dir)
+        self._lock = ReadWriteLock()
+
+    def _stem(self, words):
+        return stem_words(words, self.kamus)
+
+    # Menambahkan (atau memperbarui) dokumen; mengembalikan jumlah dokumen yang terindeks
+    def add_documents(self, file_paths, readers=DEFAULT_READERS):
+        pipeline = IngestPipeline(self.kamus, readers=readers, snippets=self.snippets)
+        added = 0
+        for file_path, terms in pipeline.run(file_paths):
+            self._lock.acquire_write()
+            try:
+                if self.lsa is not None and file_path in self.index.doc_ids:
+                    self._lsa_stale.add(file_path)
+                self.index.add_document(file_path, terms)
+            finally:
+                self._lock.release_write()
+            added += 1
+
+        # Posting yang masih tertampung dikodekan setelah seluruh dokumen masuk
+        self._lock.acquire_write()
+        try:
+            self.index.finalize()
+        finally:
+            self._lock.release_write()
+        return added
+
+    # Memuat potongan teks yang disimpan spimi.py --snippets (jika ada)
+    def load_snippets(self, index_dir):
+        path = os.path.join(index_dir, SNIPPETS_FILE)
+        if os.path.exists(path):
+            if self.snippets is None:
+                self.snippets = SnippetStore(stem=self._stem)
+            self.snippets.load(path)
+
+    # Menyimpan potongan teks di samping indeks agar dapat dimuat kembali oleh load_snippets
+    def save_snippets(self, index_dir):
+        if self.snippets is None:
+            raise ValueError("Mesin pencari dibuat tanpa potongan teks (snippets=False).")
+        self.snippets.save(os.path.join(index_dir, SNIPPETS_FILE))
+
+    # Memuat model LSA yang dibangun spimi.py --lsa-dimensions (jika ada)
+    def load_lsa(self, index_dir):
+        from lsa import LsaModel, LSA_FILE
+
+        path = os.path.join(index_dir, LSA_FILE)
+        if os.path.exists(path):
+            self.lsa = LsaModel.load(path)
+            self._lsa_stale = set()
+
+    # Membangun (ulang) model LSA dari indeks saat ini; dokumen yang ditambahkan setelahnya
+    # tidak masuk model sampai build_lsa dipanggil lagi
+    def build_lsa(self, dimensions=None):
+        from lsa import build_lsa, DEFAULT_DIMENSIONS
+
+        self._lock.acquire_read()
+        try:
+            model = build_lsa(self.index, dimensions=dimensions or DEFAULT_DIMENSIONS)
+        finally:
+            self._lock.release_read()
+        self.lsa = model
+        self._lsa_stale = set()
+        return model
+
+    def remove(self, file_path):
+        self._lock.acquire_write()
+        try:
+            if self.snippets is not None:
+                self.snippets.remove_document(file_path)
+            removed = self.index.remove_document(file_path)
+            if removed and self.lsa is not None:
+                self._lsa_stale.add(file_path)
+            return removed
+        finally:
+            self._lock.release_write()
+
+    # Menyiapkan term query: stopword dibuang, kata di-stem, wildcard diekspansi
+    # (ValueError untuk pola wildcard tanpa prefix/suffix literal)
+    def _query_terms(self, parsed_query):
+        words = [word for word in parsed_query.words if word not in self.stopwords] or parsed_query.words
+        terms = stem_words(words, self.kamus)
+        for pattern in parsed_query.wildcards:
+            terms.extend(self.index.expand_wildcard(pattern, self.max_expansions))
+        return terms
+
+    # Mencari k dokumen teratas: daftar (file_path, skor cosine),
+    # atau (file_path, skor cosine, snippet) jika with_snippets=True; snippet bernilai None jika
+    # dokumen tidak punya potongan teks (misalnya mesin dibuat tanpa snippets).
+    # mode='lsa' memakai model LSA (frasa/NEAR tidak berlaku pada mode ini).
+    # ValueError untuk k < 1, mode yang tidak dikenal, operand NEAR yang tidak valid, atau pola
+    # wildcard tanpa prefix/suffix.
+    def search(self, query, k=10, with_snippets=False, mode='vsm'):
+        if k < 1:
+            raise ValueError(f"k harus minimal 1 (diberikan {k}).")
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Mode pencarian {mode} tidak dikenal; pilih salah satu dari {', '.join(SEARCH_MODES)}.")
+        parsed_query = parse_query(query)
+        self._lock.acquire_read()
+        try:
+            query_terms = self._query_terms(parsed_query)
+            if mode == 'lsa':
+                if self.lsa is None:
+                    raise ValueError("Model LSA belum dibangun; panggil build_lsa() terlebih dahulu.")
+                # Dokumen yang dihapus atau diganti sejak model dibangun dibuang dari hasil
+                stale = self._lsa_stale
+                results = [(file_path, score)
+                           for file_path, score in self.lsa.search(query_terms, k + len(stale))
+                           if file_path not in stale and file_path in self.index.doc_ids][:k]
+            else:
+                allowed = None
+                if parsed_query.has_constraints() and self.index.store_positions:
+                    phrases, nears = stem_constraints(parsed_query, self.kamus)
+                    allowed = self.index.constrained_docs(phrases, nears)
+                results = self.index.search(query_terms, allowed=allowed, k=k)
+            if with_snippets:
+                snippets = self.snippets
+                results = [(file_path, score,
+                            snippets.snippet(file_path, query_terms) if snippets is not None else None)
+                           for file_path, score in results]
+            return results
+        finally:
+            self._lock.release_read()
+
+    def stats(self):
+        self._lock.acquire_read()
+        try:
+            compressed_bytes, plain_bytes = self.index.postings_nbytes()
+            return {
+                'documents': len(self.index),
+                'deleted': len(self.index.deleted),
+                'terms': len(self.index.postings),
+                'postings_bytes': compressed_bytes,
+                'plain_postings_bytes': plain_bytes,
+                'positions': self.index.store_positions,
+                'compressed': self.index.compressed,
+                'snippet_bytes': self.snippets.nbytes() if self.snippets is not None else 0,
+            }
+        finally:
+            self._lock.release_read()
@@ -0,0 +1,174 @@
+import argparse
+import os
+import tempfile
+from array import array
+
+from crawler import crawl_files, CrawlStats, add_crawl_arguments, crawl_options
+from postings import decode_block, iter_doc_tfs
+from spimi import read_postings, SpimiIndexBuilder, DEFAULT_MEMORY_BUDGET, POSTINGS_FILE, DOCS_FILE
+
+VOCABULARY_FILE = 'vocabulary.txt'
+DOCS_TABLE_FILE = 'docs.tsv'
+MATRIX_MARKET_FILE = 'matrix.mtx'
+NPZ_FILE = 'matrix.npz'
+# Lebar baris ukuran Matrix Market; ditulis sebagai placeholder lalu ditimpa setelah nnz diketahui
+SIZE_LINE_WIDTH = 48
+
+
+# Fungsi untuk memberi nomor baris berurutan pada dokumen yang belum dihapus
+def live_rows(index):
+    rows = {}
+    for doc_id in range(len(index.doc_paths)):
+        if doc_id not in index.deleted:
+            rows[doc_id] = len(rows)
+    return rows
+
+
+# Fungsi untuk mengambil kolom matriks (term, entri (baris, tf)) dari indeks di memori
+def index_columns(index, rows):
+    for term in index.sorted_terms():
+        yield term, ((rows[doc_id], tf) for doc_id, tf in iter_doc_tfs(index.postings[term]) if doc_id in rows)
+
+
+# Fungsi untuk membaca tabel dokumen indeks SPIMI: {doc_id: baris} dan path per baris
+def spimi_rows(index_dir):
+    rows = {}
+    doc_paths = []
+    with open(os.path.join(index_dir, DOCS_FILE), 'r', encoding='utf-8') as file:
+        for line in file:
+            doc_id, _, file_path = line.rstrip('\n').split('\t', 2)
+            rows[int(doc_id)] = len(doc_paths)
+            doc_paths.append(file_path)
+    return rows, doc_paths
+
+
+# Fungsi untuk mengambil kolom matriks langsung dari file indeks blok demi blok, tanpa memuat
+# indeks ke memori; bagian posisi pada blok tidak didekode
+def spimi_columns(index_dir, rows):
+    for term, _, blocks in read_postings(os.path.join(index_dir, POSTINGS_FILE)):
+        yield term, block_entries(blocks, rows)
+
+
+# Fungsi untuk mendekode (baris, tf) dari blok-blok posting satu term
+def block_entries(blocks, rows):
+    prev_doc = 0
+    for count, last_doc, block_data in blocks:
+        doc_ids, tfs, _ = decode_block(block_data, 0, count, prev_doc)
+        prev_doc = last_doc
+        for doc_id, tf in zip(doc_ids, tfs):
+            yield rows[doc_id], tf
+
+
+# Fungsi untuk menulis tabel dokumen, kosakata, dan matriks dokumen-term dalam satu kali baca kolom.
+# Matrix Market (coordinate, 1-based) ditulis langsung per entri; baris ukurannya diisi placeholder
+# yang ditimpa setelah jumlah term dan nnz diketahui. Untuk npz, entri dikumpulkan dalam array.
+def export_columns(columns, doc_paths, output_dir, formats=('npz', 'mm')):
+    if 'npz' in formats:
+        import numpy as np
+        from scipy import sparse
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, DOCS_TABLE_FILE), 'w', encoding='utf-8') as file:
+        for row, file_path in enumerate(doc_paths):
+            file.write(f"{row}\t{file_path}\n")
+
+    mm_path = os.path.join(output_dir, MATRIX_MARKET_FILE)
+    mm_file = open(mm_path, 'w', encoding='utf-8') if 'mm' in formats else None
+    indptr, indices, data = array('q', [0]), array('q'), array('l')
+    n_terms = nnz = 0
+    try:
+        if mm_file is not None:
+            mm_file.write("%%MatrixMarket matrix coordinate integer general\n")
+            mm_file.write("% baris = dokumen (docs.tsv), kolom = term (vocabulary.txt), nilai = frekuensi term\n")
+            size_offset = mm_file.tell()
+            mm_file.write(' ' * SIZE_LINE_WIDTH + '\n')
+
+        with open(os.path.join(output_dir, VOCABULARY_FILE), 'w', encoding='utf-8') as vocabulary_file:
+            for term, entries in columns:
+                n_terms += 1
+                vocabulary_file.write(f"{term}\n")
+                for row, tf in entries:
+                    nnz += 1
+                    if mm_file is not None:
+                        mm_file.write(f"{row + 1} {n_terms} {tf}\n")
+                    if 'npz' in formats:
+                        indices.append(row)
+                        data.append(tf)
+                indptr.append(len(indices))
+
+        if mm_file is not None:
+            mm_file.seek(size_offset)
+            mm_file.write(f"{len(doc_paths)} {n_terms} {nnz}".ljust(SIZE_LINE_WIDTH))
+    finally:
+        if mm_file is not None:
+            mm_file.close()
+
+    written = []
+    if mm_file is not None:
+        written.append(mm_path)
+    if 'npz' in formats:
+        # Entri tersusun per term (CSC); dikonversi ke CSR agar baris = dokumen
+        matrix = sparse.csc_matrix((np.frombuffer(data, dtype=data.typecode),
+                                    np.frombuffer(indices, dtype=np.int64),
+                                    np.frombuffer(indptr, dtype=np.int64)),
+                                   shape=(len(doc_paths), n_terms))
+        path = os.path.join(output_dir, NPZ_FILE)
+        sparse.save_npz(path, matrix.tocsr())
+        written.append(path)
+    return written, len(doc_paths), n_terms, nnz
+
+
+# Fungsi untuk mengekspor indeks di memori ke direktori keluaran dalam format yang dipilih ('npz', 'mm')
+def export_index(index, output_dir, formats=('npz', 'mm')):
+    rows = live_rows(index)
+    doc_paths = [index.doc_paths[doc_id] for doc_id in rows]
+    return export_columns(index_columns(index, rows), doc_paths, output_dir, formats)
+
+
+# Fungsi untuk mengekspor indeks hasil spimi.py langsung dari file, tanpa load_index
+def export_spimi_index(index_dir, output_dir, formats=('npz', 'mm')):
+    rows, doc_paths = spimi_rows(index_dir)
+    return export_columns(spimi_columns(index_dir, rows), doc_paths, output_dir, formats)
+
+
+# Program untuk mengekspor matriks dokumen-term dari indeks SPIMI atau langsung dari folder
+def main():
+    parser = argparse.ArgumentParser(description="Ekspor matriks dokumen-term ke format sparse.")
+    parser.add_argument('source', help="folder dokumen, atau direktori indeks hasil spimi.py jika --index")
+    parser.add_argument('output', help="direktori keluaran")
+    parser.add_argument('--index', action='store_true', help="source adalah direktori indeks hasil spimi.py")
+    parser.add_argument('--format', choices=['npz', 'mm', 'both'], default='both')
+    parser.add_argument('--memory-mb', type=int, default=DEFAULT_MEMORY_BUDGET // (1024 * 1024),
+                        help="anggaran memori per blok (MB) saat mengekspor folder")
+    parser.add_argument('--kamus', default='data/kamus.txt')
+    add_crawl_arguments(parser)
+    args = parser.parse_args()
+
+    formats = ('npz', 'mm') if args.format == 'both' else (args.format,)
+    if args.index:
+        if not os.path.exists(os.path.join(args.source, POSTINGS_FILE)):
+            parser.error(f"{args.source} bukan direktori indeks spimi.py ({POSTINGS_FILE} tidak ditemukan)")
+        written, n_docs, n_terms, nnz = export_spimi_index(args.source, args.output, formats)
+    else:
+        from main import load_kamus
+        from pipeline import IngestPipeline
+
+        # Folder diindeks dengan SPIMI ke direktori sementara lalu diekspor dari file,
+        # sehingga memori tidak bertambah mengikuti ukuran korpus
+        stats = CrawlStats()
+        pipeline = IngestPipeline(load_kamus(args.kamus))
+        with tempfile.TemporaryDirectory(prefix='export-') as index_dir:
+            builder = SpimiIndexBuilder(index_dir, memory_budget=args.memory_mb * 1024 * 1024)
+            for file_path, terms in pipeline.run(crawl_files(args.source, stats=stats, **crawl_options(args))):
+                builder.add_document(file_path, terms)
+            builder.finish()
+            print(stats.summary(args.source))
+            written, n_docs, n_terms, nnz = export_spimi_index(index_dir, args.output, formats)
+
+    print(f"\nMatriks: {n_docs} dokumen x {n_terms} term, {nnz} entri")
+    for path in written:
+        print(f"Ditulis: {path}")
+
+
+if __name__ == "__main__":
+    main()
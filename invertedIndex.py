@@ -0,0 +1,353 @@
+import bisect
+import fnmatch
+import math
+import re
+from collections import Counter
+
+from postings import CompressedPostings, intersect_postings, iter_doc_tfs, plain_nbytes
+
+# Token query dibaca dari kiri ke kanan: frasa "...", operator kedekatan NEAR/k
+# (contoh: python NEAR/3 data), atau kata. Kata yang memuat '*' diperlakukan sebagai wildcard,
+# contoh: kelola*, pe*an
+QUERY_TOKEN_PATTERN = re.compile(r'"([^"]*)"|\bNEAR/(\d+)\b|([\w*]+)')
+
+# Batas bawaan jumlah term hasil ekspansi wildcard agar latensi query tetap terbatas
+DEFAULT_MAX_EXPANSIONS = 50
+# Batas jumlah term kamus yang diperiksa per pola, agar pola yang jarang cocok tetap cepat
+DEFAULT_MAX_CANDIDATES = 2000
+# Posting dokumen terhapus dibuang (compaction) setelah jumlahnya mencapai batas ini
+# dan sedikitnya seperempat dari seluruh doc_id
+COMPACT_MIN_DELETED = 64
+COMPACT_RATIO = 0.25
+
+
+# Fungsi untuk delta encoding daftar posisi yang sudah terurut
+def delta_encode(positions):
+    gaps = []
+    prev = 0
+    for pos in positions:
+        gaps.append(pos - prev)
+        prev = pos
+    return gaps
+
+
+# Fungsi untuk mengembalikan posisi absolut dari hasil delta encoding
+def delta_decode(gaps):
+    positions = []
+    pos = 0
+    for gap in gaps:
+        pos += gap
+        positions.append(pos)
+    return positions
+
+
+class ParsedQuery:
+    def __init__(self, words, phrases, nears, wildcards=None):
+        self.words = words                # seluruh kata query (tanpa operator dan wildcard)
+        self.phrases = phrases            # daftar frasa, tiap frasa berupa daftar kata
+        self.nears = nears                # daftar (kata_a, kata_b, k); operand berupa daftar kata (frasa)
+        self.wildcards = wildcards or []  # pola wildcard, contoh: kelola*
+
+    def has_constraints(self):
+        return bool(self.phrases or self.nears)
+
+
+# Fungsi untuk mengurai query menjadi kata, frasa ("...") dan operator NEAR/k dalam satu kali baca.
+# Operand NEAR berupa kata atau frasa dan boleh dipakai bersama, sehingga a NEAR/2 b NEAR/3 c
+# menjadi (a, b, 2) dan (b, c, 3). Operand yang tidak dapat dipakai (tidak ada, wildcard, atau
+# operator lain) menghasilkan ValueError, bukan diabaikan.
+def parse_query(query):
+    tokens = []
+    for match in QUERY_TOKEN_PATTERN.finditer(query):
+        phrase, near, word = match.groups()
+        if phrase is not None:
+            tokens.append(('phrase', re.findall(r"\b\w+\b", phrase.lower())))
+        elif near is not None:
+            tokens.append(('near', int(near)))
+        elif '*' in word:
+            tokens.append(('wildcard', word.lower()))
+        else:
+            tokens.append(('word', re.findall(r"\w+", word.lower())))
+
+    words = []
+    phrases = []
+    nears = []
+    wildcards = []
+    for i, (kind, value) in enumerate(tokens):
+        if kind == 'word':
+            words.extend(value)
+        elif kind == 'wildcard':
+            if value.strip('*'):
+                wildcards.append(value)
+        elif kind == 'phrase':
+            words.extend(value)
+            if len(value) > 1:
+                phrases.append(value)
+        else:
+            operands = [tokens[j] if 0 <= j < len(tokens) else None for j in (i - 1, i + 1)]
+            for operand in operands:
+                if operand is None or operand[0] not in ('word', 'phrase') or not operand[1]:
+                    if operand is None:
+                        raise ValueError(f"Operator NEAR/{value} membutuhkan operand di kiri dan kanan.")
+                    if operand[0] == 'wildcard':
+                        found = f"wildcard {operand[1]}"
+                    elif operand[0] == 'near':
+                        found = f"operator NEAR/{operand[1]}"
+                    else:
+                        found = "frasa kosong"
+                    raise ValueError(f"Operand NEAR/{value} harus berupa kata atau frasa, bukan {found}.")
+            nears.append((operands[0][1], operands[1][1], value))
+    return ParsedQuery(words, phrases, nears, wildcards)
+
+
+# Fungsi untuk mengambil term terurut yang diawali prefix (pencarian biner, tanpa scan kosakata)
+def prefix_range(sorted_terms, prefix):
+    start = bisect.bisect_left(sorted_terms, prefix)
+    for i in range(start, len(sorted_terms)):
+        if not sorted_terms[i].startswith(prefix):
+            break
+        yield sorted_terms[i]
+
+
+class InvertedIndex:
+    def __init__(self, store_positions=False, compressed=False):
+        self.store_positions = store_positions
+        self.compressed = compressed
+        self.doc_paths = []
+        self.doc_ids = {}
+        self.doc_norms = []
+        # doc_id yang sudah dihapus; posting-nya tetap ada tetapi dilewati saat pencarian
+        self.deleted = set()
+        # term -> daftar posting [doc_id, tf, delta posisi], terurut menurut doc_id
+        # (CompressedPostings jika compressed=True; panggil finalize() setelah menambahkan dokumen)
+        self.postings = {}
+        # Kamus term terurut (dan versi terbaliknya untuk pola berawalan '*'), dibangun saat dibutuhkan
+        self._sorted_terms = None
+        self._sorted_reversed_terms = None
+
+    def __len__(self):
+        return len(self.doc_paths) - len(self.deleted)
+
+    # Menambahkan satu dokumen berupa daftar term (sudah di-stem) sesuai urutan kemunculan.
+    # Dokumen dengan path yang sama diganti (versi lama dihapus).
+    def add_document(self, file_path, terms):
+        self.remove_document(file_path)
+        doc_id = len(self.doc_paths)
+        self.doc_paths.append(file_path)
+        self.doc_ids[file_path] = doc_id
+
+        positions = {}
+        for pos, term in enumerate(terms):
+            positions.setdefault(term, []).append(pos)
+
+        for term, term_positions in positions.items():
+            if term not in self.postings:
+                self._sorted_terms = None
+                self._sorted_reversed_terms = None
+            gaps = delta_encode(term_positions) if self.store_positions else None
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = CompressedPostings() if self.compressed else []
+            postings.append([doc_id, len(term_positions), gaps])
+
+        self.doc_norms.append(math.sqrt(sum(len(p) ** 2 for p in positions.values())))
+        return doc_id
+
+    # Menghapus dokumen dari hasil pencarian; mengembalikan False jika dokumen tidak ada
+    def remove_document(self, file_path):
+        doc_id = self.doc_ids.pop(file_path, None)
+        if doc_id is None:
+            return False
+        self.deleted.add(doc_id)
+        if len(self.deleted) >= COMPACT_MIN_DELETED and \
+                len(self.deleted) >= COMPACT_RATIO * len(self.doc_paths):
+            self.compact()
+        return True
+
+    # Membangun ulang posting tanpa dokumen terhapus; doc_id dinomori ulang sesuai urutan semula
+    # dan term yang hanya muncul di dokumen terhapus dibuang dari kamus
+    def compact(self):
+        if not self.deleted:
+            return
+        new_ids = {}
+        doc_paths = []
+        doc_norms = []
+        for doc_id, file_path in enumerate(self.doc_paths):
+            if doc_id not in self.deleted:
+                new_ids[doc_id] = len(doc_paths)
+                doc_paths.append(file_path)
+                doc_norms.append(self.doc_norms[doc_id])
+
+        postings = {}
+        for term, old_postings in self.postings.items():
+            new_postings = None
+            for doc_id, tf, gaps in old_postings:
+                new_id = new_ids.get(doc_id)
+                if new_id is None:
+                    continue
+                if new_postings is None:
+                    new_postings = CompressedPostings() if self.compressed else []
+                new_postings.append([new_id, tf, gaps])
+            if new_postings is not None:
+                if self.compressed:
+                    new_postings.finalize()
+                postings[term] = new_postings
+
+        self.doc_paths = doc_paths
+        self.doc_norms = doc_norms
+        self.doc_ids = {file_path: doc_id for doc_id, file_path in enumerate(doc_paths)}
+        self.postings = postings
+        self.deleted = set()
+        self._sorted_terms = None
+        self._sorted_reversed_terms = None
+
+    # Jumlah dokumen (yang belum dihapus) yang memuat term
+    def doc_freq(self, term):
+        postings = self.postings.get(term, ())
+        if not self.deleted:
+            return len(postings)
+        return sum(1 for doc_id, _ in iter_doc_tfs(postings) if doc_id not in self.deleted)
+
+    # True jika term masih muncul di sedikitnya satu dokumen yang belum dihapus
+    def has_live_postings(self, term):
+        postings = self.postings.get(term, ())
+        if not self.deleted:
+            return len(postings) > 0
+        return any(doc_id not in self.deleted for doc_id, _ in iter_doc_tfs(postings))
+
+    # Mengodekan posting yang masih tertampung (tail) pada setiap term terkompresi;
+    # dipanggil setelah sekumpulan dokumen selesai ditambahkan
+    def finalize(self):
+        if self.compressed:
+            for postings in self.postings.values():
+                postings.finalize()
+
+    # Ukuran memori posting dalam byte: (indeks ini, jika disimpan sebagai list Python tanpa kompresi)
+    def postings_nbytes(self):
+        plain = sum(plain_nbytes(postings) for postings in self.postings.values())
+        if not self.compressed:
+            return plain, plain
+        return sum(postings.nbytes() for postings in self.postings.values()), plain
+
+    def sorted_terms(self):
+        sorted_terms = self._sorted_terms
+        if sorted_terms is None:
+            # Kamus terbalik diisi lebih dulu agar pembaca lain tidak melihat keadaan setengah jadi
+            sorted_terms = sorted(self.postings)
+            self._sorted_reversed_terms = sorted(term[::-1] for term in self.postings)
+            self._sorted_terms = sorted_terms
+        return sorted_terms
+
+    # Ekspansi pola prefix/wildcard menjadi term pada kamus, paling banyak max_expansions term
+    # dari paling banyak max_candidates term yang diperiksa. Bagian literal di depan '*' dicari
+    # dengan bisect pada kamus terurut; jika pola diawali '*', bagian literal di belakang dicari
+    # pada kamus term terbalik. Pola tanpa prefix maupun suffix literal (mis. *kelola*) ditolak
+    # karena harus memindai seluruh kosakata. Term yang hanya muncul di dokumen terhapus dilewati.
+    def expand_wildcard(self, pattern, max_expansions=DEFAULT_MAX_EXPANSIONS,
+                        max_candidates=DEFAULT_MAX_CANDIDATES):
+        prefix = pattern.split('*', 1)[0]
+        suffix = pattern.rsplit('*', 1)[-1]
+        if not prefix and not suffix:
+            raise ValueError(f"Pola wildcard {pattern} harus diawali atau diakhiri huruf.")
+
+        sorted_terms = self.sorted_terms()
+        if prefix:
+            candidates = prefix_range(sorted_terms, prefix)
+        else:
+            candidates = (term[::-1] for term in prefix_range(self._sorted_reversed_terms, suffix[::-1]))
+
+        expanded = []
+        for examined, term in enumerate(candidates, 1):
+            if examined > max_candidates:
+                break
+            if fnmatch.fnmatchcase(term, pattern) and self.has_live_postings(term):
+                expanded.append(term)
+                if len(expanded) >= max_expansions:
+                    break
+        return sorted(expanded)
+
+    # Mengambil posisi term pada setiap dokumen: {doc_id: [posisi, ...]}
+    def positions(self, term):
+        if not self.store_positions:
+            raise ValueError("Indeks dibuat tanpa posisi term; query frasa/NEAR tidak dapat dievaluasi.")
+        return {doc_id: delta_decode(gaps) for doc_id, _, gaps in self.postings.get(term, ())}
+
+    # Posisi awal kemunculan frasa (daftar term berurutan) pada setiap dokumen: {doc_id: [posisi, ...]}
+    def phrase_positions(self, terms):
+        term_positions = [self.positions(term) for term in terms]
+        if len(term_positions) == 1:
+            return term_positions[0]
+        candidates = set(term_positions[0])
+        for doc_positions in term_positions[1:]:
+            candidates &= doc_positions.keys()
+
+        starts = {}
+        for doc_id in candidates:
+            following = [set(doc_positions[doc_id]) for doc_positions in term_positions[1:]]
+            doc_starts = [start for start in term_positions[0][doc_id]
+                          if all(start + offset in pos_set for offset, pos_set in enumerate(following, 1))]
+            if doc_starts:
+                starts[doc_id] = doc_starts
+        return starts
+
+    # Dokumen yang memuat seluruh term frasa secara berurutan
+    def match_phrase(self, terms):
+        return set(self.phrase_positions(terms))
+
+    # Dokumen yang memuat operand a dan b (masing-masing daftar term: kata atau frasa) dengan
+    # jarak paling jauh k posisi; jarak dihitung antara ujung operand yang berdekatan
+    def match_near(self, terms_a, terms_b, k):
+        starts_a = self.phrase_positions(terms_a)
+        starts_b = self.phrase_positions(terms_b)
+
+        matched = set()
+        for doc_id in starts_a.keys() & starts_b.keys():
+            list_b = starts_b[doc_id]
+            for start_a in starts_a[doc_id]:
+                # Awal operand b yang jaraknya paling jauh k dari operand a
+                lo = start_a - (len(terms_b) - 1) - k
+                hi = start_a + (len(terms_a) - 1) + k
+                i = bisect.bisect_left(list_b, lo)
+                if i < len(list_b) and list_b[i] <= hi:
+                    matched.add(doc_id)
+                    break
+        return matched
+
+    # Irisan dokumen yang lolos semua batasan frasa dan NEAR (None jika tidak ada batasan)
+    def constrained_docs(self, phrases, nears):
+        allowed = None
+        for terms in phrases:
+            docs = self.match_phrase(terms)
+            allowed = docs if allowed is None else allowed & docs
+        for term_a, term_b, k in nears:
+            docs = self.match_near(term_a, term_b, k)
+            allowed = docs if allowed is None else allowed & docs
+        if allowed is not None:
+            allowed -= self.deleted
+        return allowed
+
+    # Cosine similarity antara query (daftar term) dan dokumen, hanya untuk dokumen kandidat
+    def search(self, query_terms, allowed=None, k=None):
+        query_counts = Counter(query_terms)
+        query_norm = math.sqrt(sum(c ** 2 for c in query_counts.values()))
+        if query_norm == 0:
+            return []
+
+        # Jika kandidat sudah disaring, posting dibaca lewat skip pointer hanya untuk dokumen kandidat
+        sorted_allowed = sorted(allowed) if allowed is not None else None
+        scores = {}
+        for term, q_count in query_counts.items():
+            postings = self.postings.get(term, ())
+            if sorted_allowed is None:
+                matches = iter_doc_tfs(postings)
+            else:
+                matches = intersect_postings(postings, sorted_allowed)
+            for doc_id, tf in matches:
+                if doc_id in self.deleted:
+                    continue
+                scores[doc_id] = scores.get(doc_id, 0) + tf * q_count
+
+        results = [(self.doc_paths[doc_id], score / (self.doc_norms[doc_id] * query_norm))
+                   for doc_id, score in scores.items()]
+        results.sort(key=lambda x: x[1], reverse=True)
+        return results[:k] if k else results
@@ -0,0 +1,172 @@
+import argparse
+import random
+
+import numpy as np
+from scipy import sparse
+
+from postings import iter_doc_tfs
+
+DEFAULT_DIMENSIONS = 200
+DEFAULT_OVERSAMPLE = 10
+DEFAULT_POWER_ITERATIONS = 2
+
+
+LSA_FILE = 'lsa.npz'
+
+
+# Fungsi untuk menyusun matriks dokumen-term (SciPy CSR) dari posting indeks.
+# Hanya dokumen yang belum dihapus yang mendapat baris; doc_paths mengikuti urutan baris.
+def document_term_matrix(index):
+    doc_paths = []
+    doc_rows = {}
+    for doc_id, file_path in enumerate(index.doc_paths):
+        if doc_id not in index.deleted:
+            doc_rows[doc_id] = len(doc_paths)
+            doc_paths.append(file_path)
+
+    terms = index.sorted_terms()
+    rows, cols, vals = [], [], []
+    for term_id, term in enumerate(terms):
+        for doc_id, tf in iter_doc_tfs(index.postings[term]):
+            row = doc_rows.get(doc_id)
+            if row is None:
+                continue
+            rows.append(row)
+            cols.append(term_id)
+            vals.append(tf)
+    matrix = sparse.csr_matrix((np.array(vals, dtype=np.float64),
+                                (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64))),
+                               shape=(len(doc_paths), len(terms)))
+    return doc_paths, terms, matrix
+
+
+class LsaModel:
+    def __init__(self, doc_paths, terms, term_vectors, doc_embeddings):
+        self.doc_paths = doc_paths
+        self.term_ids = {term: i for i, term in enumerate(terms)}
+        self.term_vectors = term_vectors      # V x k: proyeksi term ke ruang laten
+        self.doc_embeddings = doc_embeddings  # N x k, sudah dinormalisasi panjangnya 1
+
+    @property
+    def dimensions(self):
+        return self.doc_embeddings.shape[1]
+
+    # Memproyeksikan query (daftar term hasil stemming) ke ruang laten
+    def project_query(self, query_terms):
+        vector = np.zeros(self.dimensions)
+        for term in query_terms:
+            term_id = self.term_ids.get(term)
+            if term_id is not None:
+                vector += self.term_vectors[term_id]
+        return vector
+
+    # Skor seluruh dokumen dengan satu perkalian matriks-vektor; dokumen dengan skor <= 0 dibuang
+    def search(self, query_terms, k=10):
+        query_vector = self.project_query(query_terms)
+        norm = np.linalg.norm(query_vector)
+        if norm == 0:
+            return []
+        scores = self.doc_embeddings @ (query_vector / norm)
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.doc_paths[doc_id], float(scores[doc_id])) for doc_id in top if scores[doc_id] > 0]
+
+    def save(self, path):
+        np.savez(path, doc_paths=np.array(self.doc_paths), terms=np.array(sorted(self.term_ids, key=self.term_ids.get)),
+                 term_vectors=self.term_vectors, doc_embeddings=self.doc_embeddings)
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        return cls(data['doc_paths'].tolist(), data['terms'].tolist(),
+                   data['term_vectors'], data['doc_embeddings'])
+
+
+# Fungsi untuk membangun model LSA dengan randomized truncated SVD (hanya CPU).
+# Embedding dokumen = U_k * S_k, proyeksi query = q * V_k, sehingga hasil kali keduanya
+# mendekati hasil kali titik dokumen-query pada matriks asli (rank-k).
+def build_lsa(index, dimensions=DEFAULT_DIMENSIONS, oversample=DEFAULT_OVERSAMPLE,
+              power_iterations=DEFAULT_POWER_ITERATIONS, seed=0):
+    doc_paths, terms, matrix = document_term_matrix(index)
+    n_docs, n_terms = matrix.shape
+    if n_docs == 0 or n_terms == 0:
+        raise ValueError("Indeks kosong; model LSA tidak dapat dibangun.")
+    dimensions = min(dimensions, n_docs, n_terms)
+    size = min(dimensions + oversample, n_docs, n_terms)
+
+    rng = np.random.default_rng(seed)
+    omega = rng.standard_normal((n_terms, size))
+    # Transpos dibuat sekali (CSR) agar perkalian A.T @ x sama cepatnya dengan A @ x
+    matrix_t = matrix.T.tocsr()
+    q, _ = np.linalg.qr(matrix @ omega)
+    for _ in range(power_iterations):
+        z, _ = np.linalg.qr(matrix_t @ q)
+        q, _ = np.linalg.qr(matrix @ z)
+
+    b = (matrix_t @ q).T
+    u_b, s, vt = np.linalg.svd(b, full_matrices=False)
+    u = q @ u_b[:, :dimensions]
+    s = s[:dimensions]
+
+    doc_embeddings = u * s
+    norms = np.linalg.norm(doc_embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    doc_embeddings = (doc_embeddings / norms).astype(np.float32)
+    term_vectors = vt[:dimensions].T.astype(np.float32)
+    return LsaModel(doc_paths, terms, term_vectors, doc_embeddings)
+
+
+# Fungsi untuk mengukur recall@k LSA terhadap cosine eksak pada indeks
+def recall_at_k(index, model, queries, k=10):
+    recalls = []
+    for query_terms in queries:
+        exact = {file_path for file_path, _ in index.search(query_terms, k=k)}
+        if not exact:
+            continue
+        approx = {file_path for file_path, _ in model.search(query_terms, k=k)}
+        recalls.append(len(exact & approx) / len(exact))
+    return sum(recalls) / len(recalls) if recalls else 0.0
+
+
+# Fungsi untuk membuat query uji berupa beberapa term acak dari kosakata indeks
+def sample_queries(index, n_queries=100, terms_per_query=2, seed=0):
+    rng = random.Random(seed)
+    vocabulary = [term for term in index.sorted_terms() if index.doc_freq(term) > 1]
+    if not vocabulary:
+        return []
+    return [rng.sample(vocabulary, min(terms_per_query, len(vocabulary))) for _ in range(n_queries)]
+
+
+# Program untuk membangun model LSA dari indeks SPIMI dan melaporkan recall-nya
+def main():
+    from main import load_kamus, tokenize, stem_words
+    from spimi import load_index
+
+    parser = argparse.ArgumentParser(description="Bangun model LSA dari indeks SPIMI.")
+    parser.add_argument('index_dir', help="direktori indeks hasil spimi.py")
+    parser.add_argument('--dimensions', type=int, default=DEFAULT_DIMENSIONS)
+    parser.add_argument('--output', help="simpan model ke file .npz")
+    parser.add_argument('--query', help="query yang dicari dengan mode LSA")
+    parser.add_argument('-k', type=int, default=10)
+    parser.add_argument('--kamus', default='data/kamus.txt')
+    args = parser.parse_args()
+
+    index = load_index(args.index_dir)
+    model = build_lsa(index, dimensions=args.dimensions)
+    print(f"Model LSA: {len(model.doc_paths)} dokumen, {len(model.term_ids)} term, {model.dimensions} dimensi")
+    print(f"Recall@{args.k} terhadap cosine eksak: {recall_at_k(index, model, sample_queries(index), args.k):.3f}")
+
+    if args.output:
+        model.save(args.output)
+        print(f"Model disimpan ke: {args.output}")
+
+    if args.query:
+        query_terms = stem_words(tokenize(args.query), load_kamus(args.kamus))
+        print("\nHasil Kemiripan (LSA):")
+        for rank, (file_path, sim) in enumerate(model.search(query_terms, args.k), 1):
+            print(f"{rank}. {sim:.5f} -> {file_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import argparse
+import io
 import os
 import re
 from collections import Counter
@@ -5,6 +7,9 @@ from docx import Document
 import fitz
 import pandas as pd
 import math
+from crawler import crawl_files, CrawlStats, add_crawl_arguments, crawl_options
+from invertedIndex import InvertedIndex, parse_query, DEFAULT_MAX_EXPANSIONS
+from snippets import SnippetStore, tokenize_with_offsets
 
 # Fungsi untuk membaca file .txt
 def read_txt(file_path):
@@ -21,6 +26,20 @@ def read_pdf(file_path):
     doc = fitz.open(file_path)
     return '\n'.join(page.get_text() for page in doc)
 
+# Fungsi untuk mengambil teks dari isi file (bytes) yang sudah dibaca sebelumnya
+def text_from_bytes(file_path, data):
+    if file_path.endswith('.txt'):
+        return data.decode('utf-8')
+    elif file_path.endswith('.docx'):
+        doc = Document(io.BytesIO(data))
+        return '\n'.join(para.text for para in doc.paragraphs)
+    elif file_path.endswith('.pdf'):
+        doc = fitz.open(stream=data, filetype='pdf')
+        return '\n'.join(page.get_text() for page in doc)
+    else:
+        print(f"Format file {file_path} tidak didukung.")
+        return
+
 # Fungsi untuk tokenisasi
 def tokenize(text):
     return re.findall(r"\b\w+\b", text.lower())
@@ -111,8 +130,9 @@ def process_file_stopwords(file_path, stopwords):
     word_counts = count_important_words(text, stopwords)
     return word_counts
 
-# Fungsi untuk memproses file sesuai format yang dipilih untuk stemming
-def process_file_stemming(file_path, kamus):
+# Fungsi untuk menghasilkan daftar term hasil stemming sesuai urutan kemunculan
+# (jika snippets diberikan, potongan teks dan offset token ikut disimpan)
+def process_file_terms(file_path, kamus, snippets=None):
     if file_path.endswith('.txt'):
         text = read_txt(file_path)
     elif file_path.endswith('.docx'):
@@ -122,12 +142,36 @@ def process_file_stemming(file_path, kamus):
     else:
         print(f"Format file {file_path} tidak didukung.")
         return
-    
+
+    if snippets is not None:
+        tokens = tokenize_with_offsets(text)
+        stemmed_words = stem_words([word for word, _, _ in tokens], kamus)
+        snippets.add_document(file_path, text, tokens, stemmed_words)
+        return stemmed_words
+
     words = tokenize(text)
-    stemmed_words = stem_words(words, kamus)
+    return stem_words(words, kamus)
+
+# Fungsi untuk memproses file sesuai format yang dipilih untuk stemming
+def process_file_stemming(file_path, kamus):
+    stemmed_words = process_file_terms(file_path, kamus)
+    if stemmed_words is None:
+        return
     word_counts = Counter(stemmed_words)
     return word_counts
 
+# Fungsi untuk melakukan stemming pada frasa dan operand NEAR dari query
+def stem_constraints(parsed_query, kamus):
+    phrases = [stem_words(words, kamus) for words in parsed_query.phrases]
+    nears = [(stem_words(a, kamus), stem_words(b, kamus), k) for a, b, k in parsed_query.nears]
+    return phrases, nears
+
+# Fungsi untuk menyaring dokumen yang memenuhi frasa dan operator NEAR pada query
+def filter_by_constraints(index, parsed_query, kamus):
+    phrases, nears = stem_constraints(parsed_query, kamus)
+    allowed = index.constrained_docs(phrases, nears)
+    return {index.doc_paths[doc_id] for doc_id in allowed}
+
 # Fungsi untuk menghitung kemiripan dokumen menggunakan cosine similarity
 def cosine_similarity(vec1, vec2):
     intersection = set(vec1) & set(vec2)
@@ -141,11 +185,42 @@ def cosine_similarity(vec1, vec2):
         return numerator / denominator
 
 
-def display_similarity(file_paths, stopwords, kamus, query):
-    # Preprocessing query
-    query_words = tokenize(query)
+def display_similarity(file_paths, stopwords, kamus, query, index=None,
+                       max_expansions=DEFAULT_MAX_EXPANSIONS, snippets=None):
+    # Preprocessing query (frasa "..." dan operator NEAR/k dipisahkan dari kata query)
+    try:
+        parsed_query = parse_query(query)
+    except ValueError as e:
+        print(e)
+        return
+    query_words = parsed_query.words
     query_words_stemmed = stem_words(query_words, kamus)
 
+    # Ekspansi prefix/wildcard terhadap kamus term indeks (term indeks sudah di-stem)
+    for pattern in parsed_query.wildcards:
+        if index is None:
+            print(f"Query wildcard {pattern} membutuhkan indeks; diabaikan.")
+            continue
+        try:
+            expanded = index.expand_wildcard(pattern, max_expansions)
+        except ValueError as e:
+            print(e)
+            continue
+        print(f"{pattern} -> {', '.join(expanded) if expanded else '(tidak ada term)'}")
+        query_words = query_words + expanded
+        query_words_stemmed = query_words_stemmed + expanded
+
+    # Dokumen yang tidak memenuhi frasa/NEAR dibuang sebelum perhitungan cosine
+    if parsed_query.has_constraints():
+        if index is None or not index.store_positions:
+            print("Query frasa/NEAR membutuhkan indeks posisi; batasan diabaikan.")
+        else:
+            allowed = filter_by_constraints(index, parsed_query, kamus)
+            file_paths = [file_path for file_path in file_paths if file_path in allowed]
+            if not file_paths:
+                print("Tidak ada dokumen yang memenuhi frasa/kedekatan pada query.")
+                return
+
     # Menghitung bobot term
     document_word_counts = {}
     for file_path in file_paths:
@@ -238,11 +313,41 @@ def display_similarity(file_paths, stopwords, kamus, query):
     sorted_similarities = sorted(similarities.items(), key=lambda x: x[1], reverse=True)
     for rank, (file_path, sim) in enumerate(sorted_similarities, 1):
         print(f"{rank}. D{file_paths.index(file_path)+1} = {sim:.5f} -> {os.path.basename(file_path)}")
+        snippet = snippets.snippet(file_path, query_words_stemmed) if snippets is not None else None
+        if snippet:
+            print(f"   {snippet}")
+
 
+# Fungsi untuk menampilkan hasil preprocessing satu file dalam format tabel
+def display_preprocessing(file_path, stopwords, kamus, snippets=None):
+    word_counts_stopwords = process_file_stopwords(file_path, stopwords)
+    stemmed_words = process_file_terms(file_path, kamus, snippets)
+    word_counts_stemming = Counter(stemmed_words)
+
+    print(f"\nMembaca file: {os.path.basename(file_path)}")
+    print("+-------------------------+-----------------------+--------+")
+    print("| hasil stopremoval       | hasil stemming         | jumlah |")
+    print("+-------------------------+-----------------------+--------+")
+
+    all_words = set(word_counts_stopwords.keys()).union(set(word_counts_stemming.keys()))
+
+    for word in sorted(all_words):  # Sort kata-katanya agar tampil teratur
+        stopword_count = word_counts_stopwords.get(word, 0)
+        stemmed_word = remove_affixes(word, kamus)
+        stemmed_count = word_counts_stemming.get(stemmed_word, 0)
+        print(f"| {word:<23} | {stemmed_word:<21} | {stopword_count + stemmed_count:<6} |")
+
+    print("+-------------------------+-----------------------+--------+")
+    return stemmed_words
 
 
 # Program Utama
 def main():
+    # Opsi penelusuran folder (pola, batas ukuran, symlink) bersifat opsional
+    parser = argparse.ArgumentParser(description="Preprocessing dan pencarian dokumen pada folder.")
+    add_crawl_arguments(parser)
+    args = parser.parse_args()
+
     stopword_file = 'data/stopwordbahasa.csv'
     kamus_file = 'data/kamus.txt'
 
@@ -253,43 +358,32 @@ def main():
     print("Masukkan direktori folder yang berisi file:")
     folder_path = input().strip()
 
-    # Ambil daftar file dalam direktori
-    file_paths = [os.path.join(folder_path, f) for f in os.listdir(folder_path) if f.endswith(('.txt', '.docx', '.pdf'))]
+    print("\n=== Proses 2: PreProcessing ===")
+
+    # Telusuri folder secara rekursif; path diproses satu per satu saat ditemukan
+    stats = CrawlStats()
+    # Posisi term disimpan per posting untuk query frasa dan NEAR/k; posting dikompresi
+    index = InvertedIndex(store_positions=True, compressed=True)
+    # Potongan teks disimpan saat preprocessing agar hasil pencarian tidak perlu membaca file lagi
+    snippets = SnippetStore(stem=lambda words: stem_words(words, kamus))
+    file_paths = []
+    for file_path in crawl_files(folder_path, stats=stats, **crawl_options(args)):
+        file_paths.append(file_path)
+        stemmed_words = display_preprocessing(file_path, stopwords, kamus, snippets)
+        index.add_document(file_path, stemmed_words)
+    index.finalize()
+
+    print()
+    print(stats.summary(folder_path))
 
     if not file_paths:
         print("Tidak ada file yang ditemukan di folder tersebut.")
         return
 
-    print(f"\nList file pada direktori {os.path.basename(folder_path)}:")
-    for idx, file_path in enumerate(file_paths, 1):
-        print(f"{idx}. {os.path.basename(file_path)}")
-
-    print("\n=== Proses 2: PreProcessing ===")
-    
-    for file_path in file_paths:
-        word_counts_stopwords = process_file_stopwords(file_path, stopwords)
-        word_counts_stemming = process_file_stemming(file_path, kamus)
-
-        # Tampilkan hasil dalam format tabel
-        print(f"\nMembaca file: {os.path.basename(file_path)}")
-        print("+-------------------------+-----------------------+--------+")
-        print("| hasil stopremoval       | hasil stemming         | jumlah |")
-        print("+-------------------------+-----------------------+--------+")
-        
-        all_words = set(word_counts_stopwords.keys()).union(set(word_counts_stemming.keys()))
-        
-        for word in sorted(all_words):  # Sort kata-katanya agar tampil teratur
-            stopword_count = word_counts_stopwords.get(word, 0)
-            stemmed_word = remove_affixes(word, kamus)
-            stemmed_count = word_counts_stemming.get(stemmed_word, 0)
-            print(f"| {word:<23} | {stemmed_word:<21} | {stopword_count + stemmed_count:<6} |")
-        
-        print("+-------------------------+-----------------------+--------+")
-
     # Proses pencarian query
     print("\n=== Proses 3: Cari Query ===")
     query = input("Masukkan query: ").strip()
-    display_similarity(file_paths, stopwords, kamus, query)
+    display_similarity(file_paths, stopwords, kamus, query, index=index, snippets=snippets)
 
 if __name__ == "__main__":
     main()
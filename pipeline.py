@@ -0,0 +1,176 @@
+import queue
+import threading
+import time
+
+from main import text_from_bytes, tokenize, stem_words
+from snippets import tokenize_with_offsets
+
+DEFAULT_READERS = 4
+DEFAULT_WORKERS = 1
+DEFAULT_PREFETCH = 16
+
+# Penanda akhir antrean
+_DONE = object()
+
+
+class StageStats:
+    def __init__(self, name, threads):
+        self.name = name
+        self.threads = threads
+        self.items = 0
+        self.busy = 0.0    # detik mengerjakan tugas tahap ini
+        self.blocked = 0.0  # detik menunggu antrean (kosong atau penuh)
+        self.lock = threading.Lock()
+
+    def record(self, busy, blocked):
+        with self.lock:
+            self.items += 1
+            self.busy += busy
+            self.blocked += blocked
+
+    def utilization(self, wall_time):
+        return self.busy / (self.threads * wall_time) if wall_time > 0 else 0.0
+
+
+class IngestPipeline:
+    # Thread pembaca mengambil isi file (bytes) ke antrean terbatas sementara worker mem-parsing,
+    # tokenisasi dan stemming. Antrean penuh membuat pembaca menunggu (backpressure), sehingga
+    # paling banyak `prefetch` file mentah berada di memori. Jika snippets (SnippetStore) diberikan,
+    # worker juga menyimpan potongan teks dan offset token setiap dokumen.
+    def __init__(self, kamus, readers=DEFAULT_READERS, workers=DEFAULT_WORKERS, prefetch=DEFAULT_PREFETCH,
+                 snippets=None):
+        self.kamus = kamus
+        self.snippets = snippets
+        self.readers = readers
+        self.workers = workers
+        self.prefetch = prefetch
+        self.read_stats = StageStats('baca', readers)
+        self.parse_stats = StageStats('parse+stem', workers)
+        self.errors = 0
+        self.errors_lock = threading.Lock()
+        self.wall_time = 0.0
+
+    def _add_error(self):
+        with self.errors_lock:
+            self.errors += 1
+
+    # Memasukkan item ke antrean; berhenti menunggu jika pipeline dibatalkan
+    def _put(self, q, item, stop):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _reader(self, paths, paths_lock, raw_queue, stop):
+        while not stop.is_set():
+            with paths_lock:
+                file_path = next(paths, None)
+            if file_path is None:
+                break
+            start = time.perf_counter()
+            try:
+                with open(file_path, 'rb') as file:
+                    data = file.read()
+            except OSError as e:
+                print(f"Gagal membaca {file_path}: {e}")
+                self._add_error()
+                continue
+            busy = time.perf_counter() - start
+            if not self._put(raw_queue, (file_path, data), stop):
+                break
+            self.read_stats.record(busy, time.perf_counter() - start - busy)
+
+    # Parsing, tokenisasi dan stemming satu file; None jika format tidak didukung
+    def _process(self, file_path, data):
+        text = text_from_bytes(file_path, data)
+        if text is None:
+            return None
+        if self.snippets is not None:
+            tokens = tokenize_with_offsets(text)
+            terms = stem_words([word for word, _, _ in tokens], self.kamus)
+            self.snippets.add_document(file_path, text, tokens, terms)
+            return terms
+        return stem_words(tokenize(text), self.kamus)
+
+    # Penanda akhir selalu dikirim (finally) agar run() tidak menunggu selamanya
+    # walaupun worker berhenti karena kesalahan
+    def _worker(self, raw_queue, result_queue, stop):
+        try:
+            wait_start = time.perf_counter()
+            while not stop.is_set():
+                try:
+                    item = raw_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is _DONE:
+                    break
+                start = time.perf_counter()
+                file_path, data = item
+                try:
+                    terms = self._process(file_path, data)
+                except Exception as e:
+                    print(f"Gagal memproses {file_path}: {e}")
+                    self._add_error()
+                    terms = None
+                if terms is None:
+                    wait_start = time.perf_counter()
+                    continue
+                busy = time.perf_counter() - start
+                self._put(result_queue, (file_path, terms), stop)
+                now = time.perf_counter()
+                self.parse_stats.record(busy, now - wait_start - busy)
+                wait_start = now
+        finally:
+            self._put(result_queue, _DONE, stop)
+
+    # Menjalankan pipeline untuk path (iterable) dan menghasilkan (file_path, terms) sesuai urutan selesai
+    def run(self, file_paths):
+        raw_queue = queue.Queue(maxsize=self.prefetch)
+        result_queue = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+        paths = iter(file_paths)
+        paths_lock = threading.Lock()
+
+        readers = [threading.Thread(target=self._reader, args=(paths, paths_lock, raw_queue, stop), daemon=True)
+                   for _ in range(self.readers)]
+        workers = [threading.Thread(target=self._worker, args=(raw_queue, result_queue, stop), daemon=True)
+                   for _ in range(self.workers)]
+
+        # Setelah semua pembaca selesai, kirim penanda akhir ke setiap worker
+        def close_raw_queue():
+            for thread in readers:
+                thread.join()
+            for _ in workers:
+                self._put(raw_queue, _DONE, stop)
+
+        closer = threading.Thread(target=close_raw_queue, daemon=True)
+        start = time.perf_counter()
+        for thread in readers + workers + [closer]:
+            thread.start()
+
+        try:
+            finished = 0
+            while finished < len(workers):
+                item = result_queue.get()
+                if item is _DONE:
+                    finished += 1
+                    continue
+                yield item
+        finally:
+            # Konsumen berhenti lebih awal atau selesai: hentikan semua thread
+            stop.set()
+            for thread in readers + workers + [closer]:
+                thread.join()
+            self.wall_time = time.perf_counter() - start
+
+    def report(self):
+        lines = [f"Pipeline ingest ({self.wall_time:.2f} detik):"]
+        for stats in (self.read_stats, self.parse_stats):
+            lines.append(f"- {stats.name:<10}: {stats.items} file, {stats.threads} thread, "
+                         f"utilisasi {stats.utilization(self.wall_time):.0%}, menunggu antrean {stats.blocked:.2f} detik")
+        if self.errors:
+            lines.append(f"- gagal     : {self.errors} file")
+        return '\n'.join(lines)
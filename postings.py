@@ -0,0 +1,257 @@
+import bisect
+import sys
+from array import array
+from itertools import accumulate
+
+# Jumlah posting per blok; setiap blok (kecuali yang terakhir) punya satu skip pointer
+BLOCK_SIZE = 128
+
+# Tabel untuk jalur cepat vbyte_decode: byte penutup (bit tertinggi 1) -> nilainya
+LOW_BITS = bytes(byte & 0x7F for byte in range(256))
+TERMINATOR_BYTES = bytes(range(128, 256))
+
+
+# Fungsi untuk variable-byte encoding: 7 bit data per byte, bit tertinggi menandai byte terakhir
+def vbyte_encode(numbers, output=None):
+    output = bytearray() if output is None else output
+    for number in numbers:
+        while number >= 128:
+            output.append(number & 0x7F)
+            number >>= 7
+        output.append(number | 0x80)
+    return output
+
+
+# Fungsi untuk membaca count bilangan hasil vbyte_encode mulai dari offset
+def vbyte_decode(data, offset, count):
+    # Jalur cepat: jika count byte berikutnya semuanya byte penutup (setiap bilangan < 128),
+    # seluruhnya didekode dengan translate tanpa perulangan per byte
+    chunk = data[offset:offset + count]
+    if len(chunk) == count and not chunk.translate(None, TERMINATOR_BYTES):
+        return list(chunk.translate(LOW_BITS)), offset + count
+
+    numbers = []
+    number = shift = 0
+    while len(numbers) < count:
+        byte = data[offset]
+        offset += 1
+        if byte & 0x80:
+            numbers.append(number | ((byte & 0x7F) << shift))
+            number = shift = 0
+        else:
+            number |= byte << shift
+            shift += 7
+    return numbers, offset
+
+
+# Fungsi untuk mengodekan satu blok posting (doc_id, tf, gaps) ke output: delta doc_id terhadap
+# prev_doc lalu tf (vbyte), diikuti bagian posisi jika has_positions
+def encode_block(postings, prev_doc, has_positions, output):
+    doc_gaps = []
+    for doc_id, _, _ in postings:
+        doc_gaps.append(doc_id - prev_doc)
+        prev_doc = doc_id
+    vbyte_encode(doc_gaps, output)
+    vbyte_encode((tf for _, tf, _ in postings), output)
+    if has_positions:
+        for _, _, gaps in postings:
+            vbyte_encode(gaps, output)
+    return output
+
+
+# Fungsi untuk membaca doc_id dan tf satu blok (tanpa posisi); mengembalikan juga offset bagian posisi
+def decode_block(data, offset, count, prev_doc):
+    doc_gaps, offset = vbyte_decode(data, offset, count)
+    tfs, offset = vbyte_decode(data, offset, count)
+    doc_ids = list(accumulate(doc_gaps, initial=prev_doc))[1:]
+    return doc_ids, tfs, offset
+
+
+# Fungsi untuk membaca bagian posisi satu blok (delta posisi per posting)
+def decode_positions(data, offset, tfs):
+    all_gaps = []
+    for tf in tfs:
+        gaps, offset = vbyte_decode(data, offset, tf)
+        all_gaps.append(gaps)
+    return all_gaps
+
+
+# Fungsi untuk menghitung ukuran memori satu posting [doc_id, tf, gaps] sebagai objek Python
+def posting_object_nbytes(posting):
+    doc_id, tf, gaps = posting
+    # Bilangan -5..256 di-cache oleh Python sehingga tidak dihitung
+    size = sys.getsizeof(posting) + sum(sys.getsizeof(n) for n in (doc_id, tf) if n > 256)
+    if gaps is not None:
+        size += sys.getsizeof(gaps) + sum(sys.getsizeof(n) for n in gaps if n > 256)
+    return size
+
+
+class CompressedPostings:
+    # Posting [doc_id, tf, gaps] dikodekan per blok BLOCK_SIZE (encode_block) dalam satu objek bytes;
+    # hanya blok terakhir yang boleh tidak penuh. Skip pointer (doc_id terakhir tiap blok dan offset
+    # blok berikutnya) hanya dibuat jika ada lebih dari satu blok, sehingga term yang jarang cukup
+    # satu objek bytes. Posting baru ditampung di tail dan dikodekan saat blok penuh atau finalize().
+    __slots__ = ('data', 'skip_docs', 'skip_offsets', 'last_doc', 'encoded', 'has_positions', 'tail')
+
+    def __init__(self):
+        self.data = b''
+        self.skip_docs = None     # array('l'): doc_id terakhir blok 0..n-2
+        self.skip_offsets = None  # array('l'): offset blok 1..n-1
+        self.last_doc = 0         # doc_id terakhir yang sudah dikodekan
+        self.encoded = 0          # jumlah posting yang sudah dikodekan
+        self.has_positions = False
+        self.tail = None          # posting yang belum dikodekan
+
+    def __len__(self):
+        return self.encoded + (len(self.tail) if self.tail else 0)
+
+    def _n_blocks(self):
+        if not self.encoded:
+            return 0
+        return len(self.skip_docs) + 1 if self.skip_docs is not None else 1
+
+    def _block_count(self, block):
+        return min(BLOCK_SIZE, self.encoded - block * BLOCK_SIZE)
+
+    def _block_start(self, block):
+        if block == 0:
+            return 0, 0
+        return self.skip_offsets[block - 1], self.skip_docs[block - 1]
+
+    def append(self, posting):
+        doc_id, tf, gaps = posting
+        if gaps is not None:
+            self.has_positions = True
+        if self.tail is None:
+            self.tail = []
+        self.tail.append((doc_id, tf, gaps))
+        n_blocks = self._n_blocks()
+        last_count = self._block_count(n_blocks - 1) if n_blocks else 0
+        if last_count % BLOCK_SIZE + len(self.tail) >= BLOCK_SIZE:
+            self._encode_tail()
+
+    # Menambahkan satu blok yang sudah dikodekan (dari file indeks); semua blok sebelumnya harus penuh
+    def append_block(self, block_data, count, last_doc, has_positions):
+        data = self.data if isinstance(self.data, bytearray) else bytearray(self.data)
+        if self.encoded:
+            if self.skip_docs is None:
+                self.skip_docs, self.skip_offsets = array('l'), array('l')
+            self.skip_docs.append(self.last_doc)
+            self.skip_offsets.append(len(data))
+        data += block_data
+        self.data = data
+        self.last_doc = last_doc
+        self.encoded += count
+        self.has_positions = has_positions
+
+    # Mengodekan tail; blok terakhir yang belum penuh didekode lalu dikodekan ulang bersama tail
+    def _encode_tail(self):
+        postings = self.tail
+        self.tail = None
+        n_blocks = self._n_blocks()
+        if n_blocks and self._block_count(n_blocks - 1) < BLOCK_SIZE:
+            block = n_blocks - 1
+            reopened = list(self._iter_block(block))
+            offset, self.last_doc = self._block_start(block)
+            if block:
+                self.skip_docs.pop()
+                self.skip_offsets.pop()
+                if not self.skip_docs:
+                    self.skip_docs = self.skip_offsets = None
+            self.data = self.data[:offset]
+            self.encoded -= len(reopened)
+            postings = reopened + postings
+
+        for start in range(0, len(postings), BLOCK_SIZE):
+            chunk = postings[start:start + BLOCK_SIZE]
+            block_data = encode_block(chunk, self.last_doc, self.has_positions, bytearray())
+            self.append_block(block_data, len(chunk), chunk[-1][0], self.has_positions)
+
+    # Mengodekan posting yang tersisa di tail dan memadatkan data; dipanggil setelah indeks selesai dibangun
+    def finalize(self):
+        if self.tail:
+            self._encode_tail()
+        if isinstance(self.data, bytearray):
+            self.data = bytes(self.data)
+
+    def _iter_block(self, block):
+        offset, prev_doc = self._block_start(block)
+        doc_ids, tfs, positions_offset = decode_block(self.data, offset, self._block_count(block), prev_doc)
+        if self.has_positions:
+            all_gaps = decode_positions(self.data, positions_offset, tfs)
+        else:
+            all_gaps = [None] * len(doc_ids)
+        return zip(doc_ids, tfs, all_gaps)
+
+    def __iter__(self):
+        for block in range(self._n_blocks()):
+            for doc_id, tf, gaps in self._iter_block(block):
+                yield [doc_id, tf, gaps]
+        for doc_id, tf, gaps in self.tail or ():
+            yield [doc_id, tf, gaps]
+
+    # (doc_id, tf) seluruh posting tanpa mendekompresi bagian posisi
+    def doc_tfs(self):
+        for block in range(self._n_blocks()):
+            offset, prev_doc = self._block_start(block)
+            doc_ids, tfs, _ = decode_block(self.data, offset, self._block_count(block), prev_doc)
+            yield from zip(doc_ids, tfs)
+        for doc_id, tf, _ in self.tail or ():
+            yield doc_id, tf
+
+    # Posting (tanpa posisi) untuk doc_id terurut yang diminta; blok yang tidak memuat
+    # doc_id tersebut dilompati memakai skip pointer tanpa didekompresi
+    def intersect(self, sorted_doc_ids):
+        n_blocks = self._n_blocks()
+        skip_docs = self.skip_docs if self.skip_docs is not None else ()
+        block = 0
+        decoded_block = -1
+        doc_ids = tfs = None
+        for doc_id in sorted_doc_ids:
+            block = bisect.bisect_left(skip_docs, doc_id, block)
+            if block < n_blocks and (block < n_blocks - 1 or doc_id <= self.last_doc):
+                if block != decoded_block:
+                    offset, prev_doc = self._block_start(block)
+                    doc_ids, tfs, _ = decode_block(self.data, offset, self._block_count(block), prev_doc)
+                    decoded_block = block
+                i = bisect.bisect_left(doc_ids, doc_id)
+                if i < len(doc_ids) and doc_ids[i] == doc_id:
+                    yield doc_id, tfs[i]
+            else:
+                for tail_doc, tf, _ in self.tail or ():
+                    if tail_doc == doc_id:
+                        yield doc_id, tf
+                        break
+
+    # Ukuran memori sebenarnya dalam byte: objek ini, data terkompresi, skip pointer, dan tail
+    # yang belum dikodekan (sebagai objek Python)
+    def nbytes(self):
+        size = sys.getsizeof(self) + sys.getsizeof(self.data)
+        if self.skip_docs is not None:
+            size += sys.getsizeof(self.skip_docs) + sys.getsizeof(self.skip_offsets)
+        if self.tail:
+            size += sys.getsizeof(self.tail) + sum(posting_object_nbytes(posting) for posting in self.tail)
+        return size
+
+
+# Fungsi untuk mengambil (doc_id, tf) seluruh posting tanpa posisi
+def iter_doc_tfs(postings):
+    if isinstance(postings, CompressedPostings):
+        return postings.doc_tfs()
+    return ((doc_id, tf) for doc_id, tf, _ in postings)
+
+
+# Fungsi untuk mengambil (doc_id, tf) posting yang doc_id-nya ada pada sorted_doc_ids
+def intersect_postings(postings, sorted_doc_ids):
+    if isinstance(postings, CompressedPostings):
+        return postings.intersect(sorted_doc_ids)
+    allowed = set(sorted_doc_ids)
+    return ((doc_id, tf) for doc_id, tf, _ in postings if doc_id in allowed)
+
+
+# Fungsi untuk menghitung ukuran memori posting tanpa kompresi (list berisi [doc_id, tf, gaps])
+# sebagai pembanding
+def plain_nbytes(postings):
+    if isinstance(postings, CompressedPostings):
+        return sys.getsizeof([None] * len(postings)) + sum(posting_object_nbytes(p) for p in postings)
+    return sys.getsizeof(postings) + sum(posting_object_nbytes(p) for p in postings)
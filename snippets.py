@@ -0,0 +1,250 @@
+import bisect
+import re
+import struct
+import threading
+import zlib
+from array import array
+from collections import Counter
+from itertools import accumulate
+
+from postings import vbyte_decode, vbyte_encode
+
+TOKEN_PATTERN = re.compile(r"\b\w+\b")
+
+# Ukuran jendela teks (jumlah token) dan jumlah jendela maksimum yang disimpan per dokumen
+WINDOW_TOKENS = 24
+MAX_WINDOWS = 32
+HIGHLIGHT_PRE = '['
+HIGHLIGHT_POST = ']'
+# File potongan teks yang disimpan di samping indeks (lihat spimi.py --snippets)
+SNIPPETS_FILE = 'snippets.bin'
+# Penanda rekaman pada file potongan teks: term baru (id berurutan) atau dokumen
+TERM_RECORD = b'T'
+DOC_RECORD = b'D'
+# Header dokumen: panjang path, blob, jumlah batas jendela, panjang tabel term, jumlah term
+DOC_HEADER = struct.Struct('<IIHII')
+TERM_HEADER = struct.Struct('<H')
+
+
+# Fungsi untuk tokenisasi beserta offset karakter: daftar (kata, awal, akhir).
+# Kata yang dihasilkan sama dengan tokenize() pada main.py.
+def tokenize_with_offsets(text):
+    return [(match.group().lower(), match.start(), match.end()) for match in TOKEN_PATTERN.finditer(text)]
+
+
+class DocumentSnippets:
+    # Teks jendela disimpan terkompresi (zlib) dalam satu blob. Untuk memilih jendela, setiap term
+    # hasil stemming dicatat sekali: id term (dari kosakata store, delta vbyte terurut) dan jendela
+    # tempat term itu pertama kali muncul. Posisi kata yang disorot dicari ulang saat query.
+    def __init__(self, blob, window_bounds, term_table, windows):
+        self.blob = blob
+        self.window_bounds = window_bounds  # batas jendela dalam karakter teks hasil dekompresi
+        self.term_table = term_table        # bytes: id term terurut, delta vbyte
+        self.windows = windows              # bytes: jendela untuk setiap id pada term_table
+
+    def window_text(self, window):
+        text = zlib.decompress(self.blob).decode('utf-8')
+        return text[self.window_bounds[window]:self.window_bounds[window + 1]]
+
+    # Jendela pertama yang memuat setiap id term yang diminta (id yang tidak ada dilewati)
+    def term_windows(self, term_ids):
+        gaps, _ = vbyte_decode(self.term_table, 0, len(self.windows))
+        doc_term_ids = list(accumulate(gaps))
+        found = {}
+        for term_id in term_ids:
+            i = bisect.bisect_left(doc_term_ids, term_id)
+            if i < len(doc_term_ids) and doc_term_ids[i] == term_id:
+                found[term_id] = self.windows[i]
+        return found
+
+    def nbytes(self):
+        return (len(self.blob) + self.window_bounds.itemsize * len(self.window_bounds)
+                + len(self.term_table) + len(self.windows))
+
+
+# Fungsi untuk memilih jendela teks dari token (kata, awal, akhir) dan term hasil stemming-nya.
+# Hanya jendela yang memuat kemunculan pertama suatu term yang disimpan (paling banyak max_windows).
+# Mengembalikan blob, batas jendela, dan {term: indeks jendela yang disimpan}.
+def build_snippets(text, tokens, terms, window_tokens=WINDOW_TOKENS, max_windows=MAX_WINDOWS):
+    first_window = {}
+    for pos, term in enumerate(terms):
+        first_window.setdefault(term, pos // window_tokens)
+    kept = sorted(set(first_window.values()))[:max_windows]
+    kept_index = {window: i for i, window in enumerate(kept)}
+
+    parts = []
+    window_bounds = array('I', [0])
+    for window in kept:
+        start_pos = window * window_tokens
+        end_pos = min(start_pos + window_tokens, len(tokens))
+        char_start = tokens[start_pos][1]
+        char_end = tokens[end_pos - 1][2]
+        parts.append(text[char_start:char_end])
+        window_bounds.append(window_bounds[-1] + char_end - char_start)
+
+    blob = zlib.compress(''.join(parts).encode('utf-8'))
+    term_windows = {term: kept_index[window] for term, window in first_window.items() if window in kept_index}
+    return blob, window_bounds, term_windows
+
+
+class TermVocabulary:
+    # Kosakata bersama untuk seluruh dokumen agar tabel term per dokumen cukup menyimpan id
+    def __init__(self):
+        self.ids = {}
+        self.terms = []
+
+    # Membuat DocumentSnippets dengan id term; term baru ditambahkan ke kosakata
+    def document(self, blob, window_bounds, term_windows):
+        entries = []
+        for term, window in term_windows.items():
+            term_id = self.ids.get(term)
+            if term_id is None:
+                term_id = self.ids[term] = len(self.terms)
+                self.terms.append(term)
+            entries.append((term_id, window))
+        entries.sort()
+        term_table = bytes(vbyte_encode(term_id - prev for (term_id, _), prev
+                                        in zip(entries, [0] + [term_id for term_id, _ in entries])))
+        return DocumentSnippets(blob, window_bounds, term_table, bytes(window for _, window in entries))
+
+
+# Fungsi untuk menulis rekaman term baru (id-nya adalah urutan kemunculan pada file)
+def write_terms(file, terms):
+    for term in terms:
+        term_bytes = term.encode('utf-8')
+        file.write(TERM_RECORD + TERM_HEADER.pack(len(term_bytes)) + term_bytes)
+
+
+# Fungsi untuk menulis potongan teks satu dokumen ke file biner
+def write_snippets(file, file_path, snippets):
+    path_bytes = file_path.encode('utf-8')
+    file.write(DOC_RECORD + DOC_HEADER.pack(len(path_bytes), len(snippets.blob), len(snippets.window_bounds),
+                                            len(snippets.term_table), len(snippets.windows)))
+    file.write(path_bytes)
+    file.write(snippets.blob)
+    file.write(snippets.window_bounds.tobytes())
+    file.write(snippets.term_table)
+    file.write(snippets.windows)
+
+
+# Fungsi untuk membaca file potongan teks: term baru ditambahkan ke vocabulary, dokumen
+# dihasilkan sebagai (file_path, DocumentSnippets) dengan id term yang sudah dipetakan ulang
+def read_snippets(file, vocabulary):
+    file_ids = []  # id term pada file -> id pada vocabulary
+    while True:
+        kind = file.read(1)
+        if not kind:
+            return
+        if kind == TERM_RECORD:
+            (term_len,) = TERM_HEADER.unpack(file.read(TERM_HEADER.size))
+            term = file.read(term_len).decode('utf-8')
+            term_id = vocabulary.ids.get(term)
+            if term_id is None:
+                term_id = vocabulary.ids[term] = len(vocabulary.terms)
+                vocabulary.terms.append(term)
+            file_ids.append(term_id)
+            continue
+
+        path_len, blob_len, n_bounds, table_len, n_terms = DOC_HEADER.unpack(file.read(DOC_HEADER.size))
+        file_path = file.read(path_len).decode('utf-8')
+        blob = file.read(blob_len)
+        window_bounds = array('I')
+        window_bounds.frombytes(file.read(n_bounds * window_bounds.itemsize))
+        gaps, _ = vbyte_decode(file.read(table_len), 0, n_terms)
+        windows = file.read(n_terms)
+        term_windows = {vocabulary.terms[file_ids[term_id]]: window
+                        for term_id, window in zip(accumulate(gaps), windows)}
+        yield file_path, vocabulary.document(blob, window_bounds, term_windows)
+
+
+class SnippetWriter:
+    # Pengganti SnippetStore saat membangun indeks di disk (spimi.py): potongan teks langsung
+    # ditulis ke file sehingga tidak menumpuk di memori (hanya kosakata yang disimpan)
+    def __init__(self, path, window_tokens=WINDOW_TOKENS, max_windows=MAX_WINDOWS):
+        self.path = path
+        self.window_tokens = window_tokens
+        self.max_windows = max_windows
+        self.vocabulary = TermVocabulary()
+        self.file = open(path, 'wb')
+        self.lock = threading.Lock()
+
+    def add_document(self, file_path, text, tokens, terms):
+        blob, window_bounds, term_windows = build_snippets(text, tokens, terms, self.window_tokens,
+                                                           self.max_windows)
+        with self.lock:
+            written = len(self.vocabulary.terms)
+            snippets = self.vocabulary.document(blob, window_bounds, term_windows)
+            write_terms(self.file, self.vocabulary.terms[written:])
+            write_snippets(self.file, file_path, snippets)
+
+    def close(self):
+        self.file.close()
+
+
+class SnippetStore:
+    # stem: fungsi daftar kata -> daftar term hasil stemming (sama dengan saat ingest), dipakai untuk
+    # mencari kata yang disorot pada jendela terpilih; tanpa stem kata dibandingkan apa adanya
+    def __init__(self, stem=None, window_tokens=WINDOW_TOKENS, max_windows=MAX_WINDOWS):
+        self.stem = stem
+        self.window_tokens = window_tokens
+        self.max_windows = max_windows
+        self.vocabulary = TermVocabulary()
+        self.documents = {}
+        self.lock = threading.Lock()
+
+    # Menyimpan potongan teks dokumen saat ingest; tokens dari tokenize_with_offsets,
+    # terms adalah hasil stemming token tersebut dengan urutan yang sama
+    def add_document(self, file_path, text, tokens, terms):
+        blob, window_bounds, term_windows = build_snippets(text, tokens, terms, self.window_tokens,
+                                                           self.max_windows)
+        with self.lock:
+            self.documents[file_path] = self.vocabulary.document(blob, window_bounds, term_windows)
+
+    def remove_document(self, file_path):
+        with self.lock:
+            return self.documents.pop(file_path, None) is not None
+
+    def nbytes(self):
+        return sum(snippets.nbytes() for snippets in self.documents.values())
+
+    def save(self, path):
+        with self.lock, open(path, 'wb') as file:
+            write_terms(file, self.vocabulary.terms)
+            for file_path, snippets in self.documents.items():
+                write_snippets(file, file_path, snippets)
+
+    # Memuat potongan teks dari file; dokumen yang tertulis lebih dari sekali memakai versi terakhir
+    def load(self, path):
+        with self.lock, open(path, 'rb') as file:
+            for file_path, snippets in read_snippets(file, self.vocabulary):
+                self.documents[file_path] = snippets
+
+    # Potongan teks dokumen dengan term query (sudah di-stem) yang disorot, tanpa membaca file
+    def snippet(self, file_path, query_terms, pre=HIGHLIGHT_PRE, post=HIGHLIGHT_POST):
+        snippets = self.documents.get(file_path)
+        if snippets is None:
+            return None
+
+        # Jendela dipilih menurut jumlah term query berbeda yang pertama kali muncul di dalamnya
+        query_terms = set(query_terms)
+        term_ids = [self.vocabulary.ids[term] for term in query_terms if term in self.vocabulary.ids]
+        window_hits = Counter(snippets.term_windows(term_ids).values())
+        if not window_hits:
+            return None
+        window = max(window_hits, key=lambda w: (window_hits[w], -w))
+
+        # Hanya jendela terpilih (paling banyak window_tokens kata) yang ditokenisasi dan di-stem ulang
+        text = snippets.window_text(window)
+        tokens = tokenize_with_offsets(text)
+        words = [word for word, _, _ in tokens]
+        terms = self.stem(words) if self.stem is not None else words
+        result = []
+        last = 0
+        for (_, start, end), term in zip(tokens, terms):
+            if term in query_terms:
+                result.append(text[last:start])
+                result.append(f"{pre}{text[start:end]}{post}")
+                last = end
+        result.append(text[last:])
+        snippet = ' '.join(''.join(result).split())
+        return f"...{snippet}..."
@@ -0,0 +1,297 @@
+import argparse
+import heapq
+import itertools
+import math
+import os
+import shutil
+import tempfile
+
+from crawler import crawl_files, CrawlStats, add_crawl_arguments, crawl_options
+from invertedIndex import InvertedIndex, delta_encode
+from postings import CompressedPostings, BLOCK_SIZE, encode_block, vbyte_encode
+
+# Perkiraan kasar ukuran objek Python (byte) untuk menghitung pemakaian memori blok
+TERM_OVERHEAD = 120
+POSTING_OVERHEAD = 90
+POSITION_OVERHEAD = 36
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+# Jumlah maksimum run yang digabung sekaligus agar jumlah file terbuka tetap terbatas
+DEFAULT_MERGE_FAN_IN = 64
+
+# Indeks akhir: posting setiap term dalam format blok vbyte yang sama dengan CompressedPostings
+POSTINGS_FILE = 'postings.bin'
+POSTINGS_MAGIC = b'SPIMI-VB1\n'
+DOCS_FILE = 'docs.txt'
+
+
+# Fungsi untuk mengubah satu posting menjadi teks: doc_id:tf:gap,gap,...
+def format_posting(doc_id, tf, gaps):
+    return f"{doc_id}:{tf}:{','.join(map(str, gaps)) if gaps else ''}"
+
+
+# Fungsi untuk membaca kembali posting dari teks
+def parse_posting(text):
+    doc_id, tf, gaps = text.split(':')
+    return [int(doc_id), int(tf), [int(g) for g in gaps.split(',')] if gaps else None]
+
+
+# Fungsi untuk membaca file run baris per baris sebagai (term, teks posting)
+def read_run(run_path):
+    with open(run_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            term, postings = line.rstrip('\n').split('\t', 1)
+            yield term, postings
+
+
+# Fungsi untuk memberi nomor run pada setiap baris agar term yang sama tetap urut menurut run
+def tagged_run(run_path, run_idx):
+    for term, postings in read_run(run_path):
+        yield term, run_idx, postings
+
+
+# Fungsi untuk k-way merge beberapa run terurut: menghasilkan (term, teks posting per run).
+# Run diberikan sesuai urutan doc_id, sehingga posting term yang sama cukup disambung.
+# Teks posting dibaca bertahap, sehingga memori tidak bergantung pada jumlah dokumen suatu term.
+def merged_terms(run_paths):
+    streams = [tagged_run(path, run_idx) for run_idx, path in enumerate(run_paths)]
+    for term, group in itertools.groupby(heapq.merge(*streams), key=lambda item: item[0]):
+        yield term, (postings for _, _, postings in group)
+
+
+# Fungsi untuk menggabungkan beberapa run menjadi satu run teks (merge bertahap)
+def merge_runs(run_paths, output_path):
+    with open(output_path, 'w', encoding='utf-8') as output:
+        for term, run_postings in merged_terms(run_paths):
+            output.write(f"{term}\t")
+            for run_idx, postings in enumerate(run_postings):
+                output.write(f" {postings}" if run_idx else postings)
+            output.write("\n")
+
+
+# Fungsi untuk membaca satu bilangan vbyte dari file; None jika file sudah habis
+def read_vbyte(file):
+    number = shift = 0
+    while True:
+        byte = file.read(1)
+        if not byte:
+            return None
+        byte = byte[0]
+        if byte & 0x80:
+            return number | ((byte & 0x7F) << shift)
+        number |= byte << shift
+        shift += 7
+
+
+# Fungsi untuk menulis satu blok: jumlah posting, doc_id terakhir, panjang data, lalu data blok
+def write_block(output, postings, prev_doc, store_positions):
+    block_data = encode_block(postings, prev_doc, store_positions, bytearray())
+    output.write(vbyte_encode((len(postings), postings[-1][0], len(block_data))))
+    output.write(block_data)
+
+
+# Fungsi untuk menulis indeks akhir dari (term, teks posting per run) dalam format blok vbyte.
+# Setiap term: panjang term dan term (UTF-8), blok-blok BLOCK_SIZE posting, lalu penanda 0.
+# Hanya satu blok yang ditampung di memori.
+def write_postings(output_path, terms, store_positions):
+    with open(output_path, 'wb') as output:
+        output.write(POSTINGS_MAGIC)
+        output.write(bytes([1 if store_positions else 0]))
+        for term, run_postings in terms:
+            term_bytes = term.encode('utf-8')
+            output.write(vbyte_encode((len(term_bytes),)))
+            output.write(term_bytes)
+            block = []
+            prev_doc = 0
+            for postings in run_postings:
+                for posting in postings.split(' '):
+                    block.append(parse_posting(posting))
+                    if len(block) == BLOCK_SIZE:
+                        write_block(output, block, prev_doc, store_positions)
+                        prev_doc = block[-1][0]
+                        block = []
+            if block:
+                write_block(output, block, prev_doc, store_positions)
+            output.write(vbyte_encode((0,)))
+
+
+# Fungsi untuk membaca indeks akhir term demi term: (term, posisi tersimpan, blok-blok).
+# Blok (jumlah posting, doc_id terakhir, data) harus dibaca habis sebelum term berikutnya.
+def read_postings(postings_path):
+    with open(postings_path, 'rb') as file:
+        if file.read(len(POSTINGS_MAGIC)) != POSTINGS_MAGIC:
+            raise ValueError(f"{postings_path} bukan file indeks spimi.py")
+        has_positions = file.read(1) == b'\x01'
+
+        def blocks():
+            while True:
+                count = read_vbyte(file)
+                if not count:
+                    return
+                last_doc = read_vbyte(file)
+                yield count, last_doc, file.read(read_vbyte(file))
+
+        while True:
+            term_len = read_vbyte(file)
+            if term_len is None:
+                return
+            yield file.read(term_len).decode('utf-8'), has_positions, blocks()
+
+
+class SpimiIndexBuilder:
+    def __init__(self, output_dir, memory_budget=DEFAULT_MEMORY_BUDGET, store_positions=False,
+                 merge_fan_in=DEFAULT_MERGE_FAN_IN):
+        self.output_dir = output_dir
+        self.memory_budget = memory_budget
+        self.store_positions = store_positions
+        self.merge_fan_in = merge_fan_in
+
+        os.makedirs(output_dir, exist_ok=True)
+        self.run_dir = tempfile.mkdtemp(prefix='runs-', dir=output_dir)
+        self.run_paths = []
+
+        # Tabel dokumen langsung ditulis ke disk agar tidak bertambah di memori
+        self.docs_file = open(os.path.join(output_dir, DOCS_FILE), 'w', encoding='utf-8')
+        self.doc_count = 0
+
+        self.block = {}
+        self.block_bytes = 0
+
+    # Menambahkan satu dokumen (daftar term hasil stemming); blok ditulis ke disk jika melewati anggaran memori
+    def add_document(self, file_path, terms):
+        doc_id = self.doc_count
+        self.doc_count += 1
+
+        positions = {}
+        for pos, term in enumerate(terms):
+            positions.setdefault(term, []).append(pos)
+
+        for term, term_positions in positions.items():
+            postings = self.block.get(term)
+            if postings is None:
+                postings = self.block[term] = []
+                self.block_bytes += TERM_OVERHEAD + len(term)
+            gaps = delta_encode(term_positions) if self.store_positions else None
+            postings.append((doc_id, len(term_positions), gaps))
+            self.block_bytes += POSTING_OVERHEAD + (POSITION_OVERHEAD * len(gaps) if gaps else 0)
+
+        norm = math.sqrt(sum(len(p) ** 2 for p in positions.values()))
+        self.docs_file.write(f"{doc_id}\t{norm}\t{file_path}\n")
+
+        if self.block_bytes >= self.memory_budget:
+            self.flush_block()
+        return doc_id
+
+    # Menulis blok saat ini sebagai run terurut menurut term, lalu mengosongkan memori
+    def flush_block(self):
+        if not self.block:
+            return
+        run_path = os.path.join(self.run_dir, f"run-{len(self.run_paths):06d}.txt")
+        with open(run_path, 'w', encoding='utf-8') as run:
+            for term in sorted(self.block):
+                postings = ' '.join(format_posting(*posting) for posting in self.block[term])
+                run.write(f"{term}\t{postings}\n")
+        self.run_paths.append(run_path)
+        self.block = {}
+        self.block_bytes = 0
+
+    # Menyelesaikan indeks: flush blok terakhir dan merge seluruh run secara bertahap
+    def finish(self):
+        self.flush_block()
+        self.docs_file.close()
+
+        run_paths = self.run_paths
+        generation = 0
+        while len(run_paths) > self.merge_fan_in:
+            merged_paths = []
+            for start in range(0, len(run_paths), self.merge_fan_in):
+                merged_path = os.path.join(self.run_dir, f"merge-{generation}-{len(merged_paths):06d}.txt")
+                merge_runs(run_paths[start:start + self.merge_fan_in], merged_path)
+                merged_paths.append(merged_path)
+            run_paths = merged_paths
+            generation += 1
+
+        # Merge terakhir langsung menulis indeks akhir dalam format blok vbyte
+        postings_path = os.path.join(self.output_dir, POSTINGS_FILE)
+        write_postings(postings_path, merged_terms(run_paths), self.store_positions)
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+        return postings_path
+
+
+# Fungsi untuk memuat indeks hasil SPIMI dari disk menjadi InvertedIndex. Blok terkompresi
+# langsung dipakai tanpa dikodekan ulang; dengan compressed=False posting didekode menjadi list.
+def load_index(index_dir, compressed=True):
+    index = InvertedIndex(compressed=compressed)
+    with open(os.path.join(index_dir, DOCS_FILE), 'r', encoding='utf-8') as file:
+        for line in file:
+            doc_id, norm, file_path = line.rstrip('\n').split('\t', 2)
+            index.doc_paths.append(file_path)
+            index.doc_ids[file_path] = int(doc_id)
+            index.doc_norms.append(float(norm))
+
+    for term, has_positions, blocks in read_postings(os.path.join(index_dir, POSTINGS_FILE)):
+        term_postings = CompressedPostings()
+        for count, last_doc, block_data in blocks:
+            term_postings.append_block(block_data, count, last_doc, has_positions)
+        term_postings.finalize()
+        index.postings[term] = term_postings if compressed else list(term_postings)
+        # Posisi tersimpan jika indeks dibangun dengan store_positions=True
+        index.store_positions = has_positions
+    return index
+
+
+# Program untuk membangun indeks dari folder dengan memori terbatas
+def main():
+    from main import load_kamus
+    from pipeline import IngestPipeline, DEFAULT_READERS, DEFAULT_PREFETCH
+    from snippets import SnippetWriter, SNIPPETS_FILE
+
+    parser = argparse.ArgumentParser(description="Bangun indeks SPIMI dari folder dokumen.")
+    parser.add_argument('folder', help="direktori folder yang berisi file")
+    parser.add_argument('output', help="direktori keluaran indeks")
+    parser.add_argument('--memory-mb', type=int, default=DEFAULT_MEMORY_BUDGET // (1024 * 1024),
+                        help="anggaran memori per blok (MB)")
+    parser.add_argument('--positions', action='store_true', help="simpan posisi term")
+    parser.add_argument('--readers', type=int, default=DEFAULT_READERS, help="jumlah thread pembaca file")
+    parser.add_argument('--prefetch', type=int, default=DEFAULT_PREFETCH,
+                        help="jumlah maksimum file mentah di antrean")
+    parser.add_argument('--snippets', action='store_true',
+                        help="simpan juga potongan teks untuk hasil pencarian yang disorot")
+    parser.add_argument('--lsa-dimensions', type=int,
+                        help="bangun juga model LSA (butuh NumPy) dengan dimensi ini")
+    parser.add_argument('--kamus', default='data/kamus.txt')
+    add_crawl_arguments(parser)
+    args = parser.parse_args()
+
+    kamus = load_kamus(args.kamus)
+    builder = SpimiIndexBuilder(args.output, memory_budget=args.memory_mb * 1024 * 1024,
+                                store_positions=args.positions)
+    # Pembacaan file (I/O) berjalan paralel dengan parsing dan stemming
+    stats = CrawlStats()
+    snippets = SnippetWriter(os.path.join(args.output, SNIPPETS_FILE)) if args.snippets else None
+    pipeline = IngestPipeline(kamus, readers=args.readers, prefetch=args.prefetch, snippets=snippets)
+    try:
+        for file_path, terms in pipeline.run(crawl_files(args.folder, stats=stats, **crawl_options(args))):
+            builder.add_document(file_path, terms)
+    finally:
+        if snippets is not None:
+            snippets.close()
+
+    print(stats.summary(args.folder))
+    print(pipeline.report())
+    print(f"\nJumlah run: {len(builder.run_paths) + (1 if builder.block else 0)}")
+    print(f"Indeks ditulis ke: {builder.finish()}")
+    if snippets is not None:
+        print(f"Potongan teks ditulis ke: {snippets.path}")
+
+    # Model LSA dibangun saat indexing dan disimpan di samping indeks
+    if args.lsa_dimensions:
+        from lsa import build_lsa, LSA_FILE
+
+        model = build_lsa(load_index(args.output), dimensions=args.lsa_dimensions)
+        model.save(os.path.join(args.output, LSA_FILE))
+        print(f"Model LSA ({model.dimensions} dimensi) ditulis ke: {os.path.join(args.output, LSA_FILE)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -75,15 +75,14 @@ def display_similarity(file_paths, stopwords, kamus, query):
     for idx, file_path in enumerate(file_paths, 1):
         vector = doc_vectors[file_path]
         row = f"|D{idx} |"
-        for word in all_words:
-            weight = vector[all_words.index(word)]
+        for weight in vector:
             row += f" {weight:<12} |"
         print(row)
 
     print("+--+--------------+" + "--------------" * len(all_words) + "+")
     
     # Menampilkan query vector
-    query_vector_display = [str(query_vector[all_words.index(word)]) for word in all_words]
+    query_vector_display = [str(weight) for weight in query_vector]
     print(f"|Q | {' | '.join(query_vector_display)} |")
 
     # Perhitungan cosine similarity dan hasil
@@ -107,12 +106,13 @@ def display_similarity(file_paths, stopwords, kamus, query):
     for rank, (file_path, sim) in enumerate(sorted_similarities, 1):
         print(f"{rank}. D{file_paths.index(file_path)+1} = {sim:.5f} -> {os.path.basename(file_path)}")
 
-# Contoh pemanggilan fungsi
-stopwords = {"dan", "di", "ke", "dari", "yang"}  # Stopword contoh
-kamus = {"belajar": "belajar", "python": "python"}  # Kamus contoh
+# Contoh pemanggilan fungsi (hanya saat dijalankan langsung, bukan saat di-import)
+if __name__ == "__main__":
+    stopwords = {"dan", "di", "ke", "dari", "yang"}  # Stopword contoh
+    kamus = {"belajar": "belajar", "python": "python"}  # Kamus contoh
 
-file_paths = ["document/dokumen 1.txt", "document/dokumen 2.txt"]
-query = "belajar python"
+    file_paths = ["document/dokumen 1.txt", "document/dokumen 2.txt"]
+    query = "belajar python"
 
-# Memanggil fungsi untuk menghitung dan menampilkan kemiripan
-display_similarity(file_paths, stopwords, kamus, query)
+    # Memanggil fungsi untuk menghitung dan menampilkan kemiripan
+    display_similarity(file_paths, stopwords, kamus, query)